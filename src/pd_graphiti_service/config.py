@@ -48,6 +48,10 @@ class Settings(BaseModel):
     
     # Export Directory Configuration
     export_directory: Path = Path("../pd-target-identification/exports")
+    watch_interval: float = 30.0  # Polling interval (seconds) for network mounts without native FS events
+    max_concurrent_ingestions: int = 4  # Exports ingested in parallel by the file monitor
+    processed_state_file: Optional[Path] = None  # Defaults to <export_directory>/.pd-graphiti/processed.json
+    max_history: int = 10000  # Processing results kept in memory by the file monitor
     
     # Logging Configuration
     log_level: str = "INFO"
@@ -64,7 +68,7 @@ class Settings(BaseModel):
     enable_prometheus: bool = True
     metrics_path: str = "/metrics"
 
-    @field_validator("export_directory", mode="before")
+    @field_validator("export_directory", "processed_state_file", mode="before")
     @classmethod
     def convert_export_directory_to_path(cls, v):
         """Convert export directory string to Path object."""
@@ -101,6 +105,10 @@ class Settings(BaseModel):
             neo4j_password=cls._get_env_var("NEO4J_PASSWORD"),
             graphiti_group_id=cls._get_env_var("GRAPHITI_GROUP_ID", "pd_target_discovery"),
             export_directory=Path(cls._get_env_var("EXPORT_DIRECTORY", "../pd-target-identification/exports")),
+            watch_interval=float(cls._get_env_var("WATCH_INTERVAL", "30.0")),
+            max_concurrent_ingestions=int(cls._get_env_var("MAX_CONCURRENT_INGESTIONS", "4")),
+            processed_state_file=cls._get_env_var("PROCESSED_STATE_FILE", "") or None,
+            max_history=int(cls._get_env_var("MAX_HISTORY", "10000")),
             log_level=cls._get_env_var("LOG_LEVEL", "INFO"),
             host=cls._get_env_var("HOST", "0.0.0.0"),
             port=int(cls._get_env_var("PORT", "8000")),
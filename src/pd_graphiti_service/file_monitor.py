@@ -20,8 +20,17 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """File monitoring service for automatic export directory processing."""
 
 import asyncio
+import hashlib
+import json
 import logging
+import mmap
+import os
+import stat
+import sys
+import tempfile
 import time
+from collections import Counter, OrderedDict, deque
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, Set, Optional, Callable, List
 from datetime import datetime
@@ -29,7 +38,15 @@ from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent, DirCreatedEvent
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import (
+    FileSystemEventHandler,
+    DirCreatedEvent,
+    FileCreatedEvent,
+    DirMovedEvent,
+    FileMovedEvent,
+)
 
 from .config import Settings
 from .ingestion_service import IngestionService
@@ -37,6 +54,131 @@ from .models import IngestionStatus
 
 logger = logging.getLogger(__name__)
 
+# Max number of memoized export directory validation results
+_VALIDITY_CACHE_SIZE = 1024
+
+# Quiet period before a newly seen export is queued; further events for the
+# same export within this window restart it, so one export -> one queue entry.
+# It also gives the exporter time to finish writing episode files.
+_EVENT_DEBOUNCE_SECONDS = 1.0
+
+# Path suffixes identifying an export manifest: one C-level str.endswith with
+# a tuple, and the separator keeps e.g. "old_manifest.json" from matching
+_MANIFEST_SUFFIXES = tuple(sep + "manifest.json" for sep in (os.sep, os.altsep) if sep)
+
+# Event types the handler acts on. Passed to watchdog as an event filter, which
+# on inotify narrows the kernel watch mask to IN_CREATE | IN_MOVE so episode
+# writes (modify/open/close/attrib) never reach Python at all
+_WATCHED_EVENTS = [DirCreatedEvent, FileCreatedEvent, DirMovedEvent, FileMovedEvent]
+
+# Max number of queued exports a worker picks up per wakeup
+_WORKER_BATCH_SIZE = 8
+
+# Manifests at least this large are hashed through mmap rather than read()
+_MMAP_THRESHOLD = 16384
+
+# Default location of the processed-export state, relative to the export directory
+_STATE_SUBDIR = ".pd-graphiti"
+_STATE_FILENAME = "processed.json"
+
+# Network filesystems where native change notifications (inotify etc.) miss
+# remote writes, so the export directory has to be polled instead
+_NETWORK_FILESYSTEMS = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "9p", "afs", "fuse.sshfs", "fuse.rclone"
+})
+
+
+def _filesystem_type(path: Path) -> Optional[str]:
+    """Get the filesystem type of the mount containing path (Linux only).
+    
+    Args:
+        path: Path to classify
+        
+    Returns:
+        Filesystem type from /proc/mounts, or None if it cannot be determined
+    """
+    try:
+        mounts = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return None
+    
+    resolved = str(path.resolve())
+    best_mount, best_type = "", None
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # /proc/mounts escapes spaces in mount points as \040
+        mount_point = fields[1].replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (resolved == mount_point or resolved.startswith(prefix)) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+    return best_type
+
+
+def _is_network_path(path: Path) -> bool:
+    """Check whether path lives on a network mount.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if path is on a network filesystem
+    """
+    if sys.platform.startswith("linux"):
+        return _filesystem_type(path) in _NETWORK_FILESYSTEMS
+    
+    if sys.platform == "win32":
+        import ctypes
+        drive = os.path.splitdrive(str(path.resolve()))[0]
+        if drive.startswith("\\\\"):  # UNC share
+            return True
+        drive_remote = 4  # DRIVE_REMOTE from GetDriveTypeW
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == drive_remote
+    
+    return False
+
+
+def _select_observer(path: Path, polling_interval: float) -> Callable[[], BaseObserver]:
+    """Choose the watchdog observer implementation for a directory.
+    
+    Local filesystems use the platform's native observer (inotify on Linux),
+    which costs nothing while idle. Network mounts fall back to polling since
+    native notifications do not see changes made by other hosts.
+    
+    Args:
+        path: Directory that will be watched
+        polling_interval: Seconds between polls when polling is required
+        
+    Returns:
+        Factory creating an unscheduled observer
+    """
+    if _is_network_path(path):
+        logger.info(f"Export directory {path} is on a network mount - using polling observer "
+                    f"({polling_interval}s interval)")
+        return partial(PollingObserver, timeout=polling_interval)
+    return Observer
+
+
+def _manifest_digest(manifest_path: Path, size: int) -> str:
+    """Hash a manifest file.
+    
+    Large manifests are hashed straight from a read-only memory map, avoiding
+    a copy into a bytes object; small ones use a single read(), which is
+    cheaper than setting up the mapping.
+    
+    Args:
+        manifest_path: Path to manifest.json
+        size: Manifest size in bytes, from an earlier stat()
+        
+    Returns:
+        Hex digest of the manifest contents
+    """
+    if size < _MMAP_THRESHOLD:
+        return hashlib.blake2b(manifest_path.read_bytes(), digest_size=16).hexdigest()
+    with open(manifest_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return hashlib.blake2b(mapped, digest_size=16).hexdigest()
+
 
 class MonitoringStatus(str, Enum):
     """Status of file monitoring service."""
@@ -50,6 +192,9 @@ class MonitoringStatus(str, Enum):
 class ProcessingResult:
     """Result of processing an export directory."""
     
+    # Up to max_history of these are retained; slots drop the per-instance __dict__
+    __slots__ = ("export_path", "status", "result", "timestamp")
+    
     def __init__(self, export_path: Path, status: IngestionStatus, result: Dict[str, Any]):
         self.export_path = export_path
         self.status = status
@@ -74,27 +219,48 @@ class ExportDirectoryHandler(FileSystemEventHandler):
         self.file_monitor = file_monitor
         
     def on_created(self, event):
-        """Handle file/directory creation events."""
-        if isinstance(event, DirCreatedEvent):
+        """Handle file/directory creation events.
+        
+        Runs on the watchdog observer thread; the export is handed to the
+        monitor's event loop, which coalesces repeated events per export.
+        """
+        if event.is_directory:
             # New directory created - check if it's an export
             export_path = Path(event.src_path)
+            if export_path.name.startswith("."):
+                # Service state (e.g. .pd-graphiti), not an export
+                return
             logger.info(f"New directory detected: {export_path}")
             
             # Schedule export processing
-            asyncio.create_task(
-                self.file_monitor._process_new_export_async(export_path)
-            )
+            self.file_monitor._schedule_export(export_path)
             
-        elif isinstance(event, FileCreatedEvent):
-            # Check if manifest.json was created in existing directory
-            if event.src_path.endswith("manifest.json"):
-                export_path = Path(event.src_path).parent
-                logger.info(f"Manifest file detected: {export_path}")
-                
-                # Schedule export processing
-                asyncio.create_task(
-                    self.file_monitor._process_new_export_async(export_path)
-                )
+        elif event.src_path.endswith(_MANIFEST_SUFFIXES):
+            # manifest.json created in an existing directory
+            export_path = Path(event.src_path).parent
+            logger.info(f"Manifest file detected: {export_path}")
+            
+            # Schedule export processing
+            self.file_monitor._schedule_export(export_path)
+
+    def on_moved(self, event):
+        """Handle file/directory move events.
+        
+        Exporters that stage a directory (or manifest) elsewhere and rename it
+        into place produce a move rather than a creation; the destination is
+        handled like a newly created path.
+        """
+        if event.is_directory:
+            export_path = Path(event.dest_path)
+            if export_path.name.startswith("."):
+                return
+            logger.info(f"Directory moved into place: {export_path}")
+            self.file_monitor._schedule_export(export_path)
+            
+        elif event.dest_path.endswith(_MANIFEST_SUFFIXES):
+            export_path = Path(event.dest_path).parent
+            logger.info(f"Manifest file moved into place: {export_path}")
+            self.file_monitor._schedule_export(export_path)
 
 
 class FileMonitor:
@@ -119,16 +285,42 @@ class FileMonitor:
         
         # Monitoring state
         self._status = MonitoringStatus.STOPPED
-        self._observer: Optional[Observer] = None
+        self._observer: Optional[BaseObserver] = None
         self._handler: Optional[ExportDirectoryHandler] = None
         
         # Processing state
         self._processing_queue: asyncio.Queue = asyncio.Queue()
         self._processed_exports: Set[str] = set()
-        self._processing_results: List[ProcessingResult] = []
+        # Exports queued or being processed, so duplicate events don't queue them twice
+        self._inflight_ids: Set[str] = set()
+        # Successfully ingested exports, persisted so a restart doesn't re-ingest them
+        self._state_path = (
+            settings.processed_state_file
+            or self.export_directory / _STATE_SUBDIR / _STATE_FILENAME
+        )
+        self._processed_meta: Dict[str, Dict[str, Any]] = self._load_state()
+        # Serializes snapshot+write so concurrent exports can't persist an older snapshot last
+        self._state_lock = asyncio.Lock()
+        # LRU of validation results keyed by (path, dir mtime, manifest mtime, manifest size)
+        self._validity_cache: OrderedDict[tuple, bool] = OrderedDict()
+        # LRU of manifest digests keyed by (manifest path, mtime, size)
+        self._fingerprint_cache: OrderedDict[tuple, str] = OrderedDict()
+        # Ring buffer: the oldest results drop off once max_history is reached
+        self._processing_results: deque[ProcessingResult] = deque(maxlen=settings.max_history)
         self._concurrent_processors = 2  # Max concurrent export processing
         self._processor_tasks: List[asyncio.Task] = []
         
+        # Caps concurrent ingestion calls across all workers; held by each in-flight task
+        self._ingestion_semaphore = asyncio.Semaphore(settings.max_concurrent_ingestions)
+        self._inflight_tasks: Set[asyncio.Task] = set()
+        
+        # Filesystem event bridge: the loop the monitor runs on, exports reported
+        # by the observer thread and debounce timers per export path
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event_backlog: deque[Path] = deque()
+        self._drain_scheduled = False
+        self._pending_exports: Dict[Path, asyncio.TimerHandle] = {}
+        
         # Event callbacks
         self._on_export_started: Optional[Callable[[Path], None]] = None
         self._on_export_completed: Optional[Callable[[ProcessingResult], None]] = None
@@ -173,6 +365,25 @@ class FileMonitor:
         self._on_export_completed = on_export_completed
         self._on_export_failed = on_export_failed
 
+    def _create_observer(self) -> BaseObserver:
+        """Create an observer for the export directory, scheduled with the current handler.
+        
+        The observer type is chosen when monitoring (re)starts, once the
+        export directory is known to exist.
+        
+        Returns:
+            Scheduled (not yet started) observer
+        """
+        observer_factory = _select_observer(self.export_directory, self.settings.watch_interval)
+        observer = observer_factory()
+        observer.schedule(
+            self._handler, 
+            str(self.export_directory), 
+            recursive=True,
+            event_filter=_WATCHED_EVENTS
+        )
+        return observer
+
     def _is_valid_export_directory(self, path: Path) -> bool:
         """Check if path appears to be a valid export directory.
         
@@ -182,67 +393,293 @@ class FileMonitor:
         Returns:
             True if appears to be valid export directory
         """
-        if not path.is_dir():
-            return False
+        return self._validate_export(path) is not None
+
+    def _validate_export(
+        self, path: Path, dir_stat: Optional[os.stat_result] = None
+    ) -> Optional[os.stat_result]:
+        """Validate an export directory, returning its manifest stat.
+        
+        Results are memoized on the directory and manifest stat results, so
+        repeated checks during an event burst cost two stat() calls. Adding
+        or removing entries in the directory changes its mtime and therefore
+        invalidates the cached result. The manifest stat is returned so
+        callers can fingerprint the export without stat'ing it again.
+        
+        Args:
+            path: Path to check
+            dir_stat: Already-fetched stat of path (e.g. from os.DirEntry.stat())
+            
+        Returns:
+            Stat of manifest.json if path appears to be a valid export directory, else None
+        """
+        if dir_stat is None:
+            try:
+                dir_stat = path.stat()
+            except OSError:
+                return None
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return None
             
         # Check for manifest.json
         manifest_path = path / "manifest.json"
-        if not manifest_path.exists():
+        try:
+            manifest_stat = manifest_path.stat()
+        except OSError:
             # Maybe manifest hasn't been created yet - wait a bit
             time.sleep(0.5)
-            if not manifest_path.exists():
-                return False
+            try:
+                manifest_stat = manifest_path.stat()
+                dir_stat = path.stat()  # Creating the manifest changed the directory mtime
+            except OSError:
+                return None
         
+        cache_key = (str(path), dir_stat.st_mtime_ns, manifest_stat.st_mtime_ns, manifest_stat.st_size)
+        is_valid = self._validity_cache.get(cache_key)
+        if is_valid is not None:
+            self._validity_cache.move_to_end(cache_key)
+        else:
+            is_valid = self._contains_episodes(path)
+            self._validity_cache[cache_key] = is_valid
+            if len(self._validity_cache) > _VALIDITY_CACHE_SIZE:
+                self._validity_cache.popitem(last=False)
+        return manifest_stat if is_valid else None
+
+    def _contains_episodes(self, path: Path) -> bool:
+        """Check if an export directory contains episodes.
+        
+        Args:
+            path: Export directory path
+            
+        Returns:
+            True if an episodes directory or episode JSON files are present
+        """
         # Check for episodes directory or episode files
         episodes_dir = path / "episodes"
-        if episodes_dir.exists() and episodes_dir.is_dir():
+        if episodes_dir.is_dir():
             return True
             
         # Check for JSON files directly in directory
         json_files = list(path.glob("*.json"))
         return len(json_files) > 1  # More than just manifest.json
         
-    def _get_export_id(self, path: Path) -> str:
+    def _get_export_id(self, path: Path, manifest_stat: Optional[os.stat_result] = None) -> str:
         """Generate unique export ID for tracking.
         
+        The ID is a digest of manifest.json, so a renamed or re-staged copy of
+        an export maps to the same ID. Digests are memoized per manifest
+        (path, mtime, size).
+        
         Args:
             path: Export directory path
+            manifest_stat: Already-fetched stat of manifest.json (e.g. from _validate_export)
             
         Returns:
             Unique export identifier
         """
-        return f"{path.name}_{int(path.stat().st_mtime)}"
+        manifest_path = path / "manifest.json"
+        if manifest_stat is None:
+            try:
+                manifest_stat = manifest_path.stat()
+            except OSError:
+                # No manifest to fingerprint - fall back to name and mtime
+                return f"{path.name}_{int(path.stat().st_mtime)}"
+        
+        key = (str(manifest_path), manifest_stat.st_mtime_ns, manifest_stat.st_size)
+        fingerprint = self._fingerprint_cache.get(key)
+        if fingerprint is None:
+            fingerprint = _manifest_digest(manifest_path, manifest_stat.st_size)
+            self._fingerprint_cache[key] = fingerprint
+            if len(self._fingerprint_cache) > _VALIDITY_CACHE_SIZE:
+                self._fingerprint_cache.popitem(last=False)
+        else:
+            self._fingerprint_cache.move_to_end(key)
+        return fingerprint
+
+    def _is_already_processed(self, export_id: str) -> bool:
+        """Check whether an export is queued, in progress, or processed in this or a previous run.
+        
+        Args:
+            export_id: Unique export identifier
+            
+        Returns:
+            True if the export should not be queued again
+        """
+        return (
+            export_id in self._inflight_ids
+            or export_id in self._processed_exports
+            or export_id in self._processed_meta
+        )
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted processed-export state.
+        
+        Returns:
+            Mapping of export ID to its processing record
+        """
+        try:
+            with open(self._state_path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable processed-export state {self._state_path}: {e}")
+            return {}
+        
+        logger.info(f"Loaded {len(state)} processed exports from {self._state_path}")
+        return state
+
+    def _serialize_state(self) -> str:
+        """Snapshot processed-export state for writing."""
+        return json.dumps(self._processed_meta, indent=2, sort_keys=True)
+
+    def _write_state(self, payload: str) -> None:
+        """Atomically write processed-export state.
+        
+        Failures are logged rather than raised, since export directories are
+        often mounted read-only.
+        
+        Args:
+            payload: Serialized state from _serialize_state
+        """
+        tmp_path = None
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp file in the target directory so os.replace stays atomic
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._state_path.parent, prefix=f"{self._state_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            logger.warning(f"Could not persist processed-export state to {self._state_path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
-    async def _process_new_export_async(self, export_path: Path):
-        """Process new export directory asynchronously.
+    async def _record_processed(self, export_path: Path, export_id: str) -> None:
+        """Record a successfully ingested export and persist the state.
         
         Args:
             export_path: Path to export directory
+            export_id: Unique export identifier
         """
         try:
-            # Wait a bit for files to be fully written
-            await asyncio.sleep(1.0)
+            mtime = export_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        
+        self._processed_meta[export_id] = {
+            "export_path": str(export_path),
+            "mtime": mtime,
+            "status": IngestionStatus.SUCCESS.value,
+        }
+        await self._persist_state()
+
+    async def _persist_state(self) -> None:
+        """Write the current processed-export state off the event loop."""
+        # Snapshot under the lock so writes land on disk in the order they were taken
+        async with self._state_lock:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_state, self._serialize_state()
+            )
+
+    def _schedule_export(self, export_path: Path) -> None:
+        """Schedule processing of a possibly new export (thread-safe).
+        
+        Args:
+            export_path: Path to export directory
+        """
+        if self._loop is None or self._loop.is_closed():
+            logger.warning(f"Ignoring filesystem event while monitor is not running: {export_path}")
+            return
+        
+        # deque appends are atomic; wake the loop only once per burst of events
+        self._event_backlog.append(export_path)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._loop.call_soon_threadsafe(self._drain_event_backlog)
+
+    def _drain_event_backlog(self) -> None:
+        """Hand all exports reported by the observer thread to the debouncer."""
+        # Reset before draining so events appended meanwhile schedule a new drain
+        self._drain_scheduled = False
+        while self._event_backlog:
+            self._debounce_export(self._event_backlog.popleft())
+
+    def _debounce_export(self, export_path: Path) -> None:
+        """(Re)start the debounce timer for an export. Runs on the event loop.
+        
+        Args:
+            export_path: Path to export directory
+        """
+        pending = self._pending_exports.get(export_path)
+        if pending is not None:
+            pending.cancel()
+        self._pending_exports[export_path] = self._loop.call_later(
+            _EVENT_DEBOUNCE_SECONDS, self._flush_pending_export, export_path
+        )
+
+    def _flush_pending_export(self, export_path: Path) -> None:
+        """Queue an export once its events have settled.
+        
+        Args:
+            export_path: Path to export directory
+        """
+        self._pending_exports.pop(export_path, None)
+        self._enqueue_export(export_path)
+
+    def _cancel_pending_exports(self) -> None:
+        """Drop exports still waiting for their debounce window to pass."""
+        self._event_backlog.clear()
+        for handle in self._pending_exports.values():
+            handle.cancel()
+        self._pending_exports.clear()
+
+    def _enqueue_export(self, export_path: Path) -> bool:
+        """Validate a new export directory and queue it for processing.
+        
+        Runs synchronously on the event loop; the queue is unbounded, so
+        put_nowait never blocks.
+        
+        Args:
+            export_path: Path to export directory
             
+        Returns:
+            True if the export was queued
+        """
+        try:
             # Validate export directory
-            if not self._is_valid_export_directory(export_path):
+            manifest_stat = self._validate_export(export_path)
+            if manifest_stat is None:
                 logger.debug(f"Skipping invalid export directory: {export_path}")
-                return
+                return False
             
             # Generate export ID and check if already processed
-            export_id = self._get_export_id(export_path)
-            if export_id in self._processed_exports:
+            export_id = self._get_export_id(export_path, manifest_stat)
+            if self._is_already_processed(export_id):
                 logger.debug(f"Export already processed: {export_id}")
-                return
+                return False
             
             logger.info(f"Queuing new export for processing: {export_path}")
-            await self._processing_queue.put((export_path, export_id))
+            self._inflight_ids.add(export_id)
+            self._processing_queue.put_nowait((export_path, export_id))
+            return True
             
         except Exception as e:
             logger.error(f"Error handling new export {export_path}: {e}")
+            return False
 
     async def _export_processor_worker(self, worker_id: int):
         """Worker task for processing exports from the queue.
         
+        Each wakeup drains up to ``_WORKER_BATCH_SIZE`` queued exports and
+        starts each one as its own task once an ingestion slot is free, so a
+        slow export doesn't hold back the ones queued behind it.
+        
         Args:
             worker_id: Unique identifier for this worker
         """
@@ -251,73 +688,137 @@ class FileMonitor:
         while self._status == MonitoringStatus.RUNNING:
             try:
                 # Wait for new export to process
-                export_path, export_id = await asyncio.wait_for(
-                    self._processing_queue.get(), timeout=1.0
-                )
-                
-                # Mark as processed to avoid duplicates
-                self._processed_exports.add(export_id)
-                
-                logger.info(f"Worker {worker_id} processing export: {export_path}")
-                
-                # Trigger callback
-                if self._on_export_started:
-                    self._on_export_started(export_path)
-                
-                # Process the export directory
-                start_time = time.time()
-                result = await self.ingestion_service.process_export_directory(
-                    export_path,
-                    validate_files=True,
-                    force_reingest=False
-                )
-                
-                processing_time = time.time() - start_time
-                result["worker_id"] = worker_id
-                result["total_processing_time"] = processing_time
-                
-                # Create processing result
-                processing_result = ProcessingResult(
-                    export_path=export_path,
-                    status=result.get("status", IngestionStatus.FAILED),
-                    result=result
-                )
-                
-                # Store result
-                self._processing_results.append(processing_result)
-                
-                # Keep only last 100 results to prevent memory growth
-                if len(self._processing_results) > 100:
-                    self._processing_results = self._processing_results[-100:]
-                
-                # Trigger completion callback
-                if processing_result.status == IngestionStatus.SUCCESS:
-                    logger.info(f"Worker {worker_id} successfully processed: {export_path}")
-                    if self._on_export_completed:
-                        self._on_export_completed(processing_result)
-                else:
-                    logger.error(f"Worker {worker_id} failed to process: {export_path}")
-                    if self._on_export_failed:
-                        error_msg = result.get("error", "Unknown processing error")
-                        self._on_export_failed(export_path, error_msg)
-                
-                # Mark task as done
-                self._processing_queue.task_done()
-                
+                batch = [await asyncio.wait_for(self._processing_queue.get(), timeout=1.0)]
             except asyncio.TimeoutError:
                 # No new exports to process - continue waiting
                 continue
-            except Exception as e:
-                logger.error(f"Error in export processor worker {worker_id}: {e}")
-                
-                # Mark task as done if we got one
+            
+            # Pick up whatever else is already waiting without another suspension
+            while len(batch) < _WORKER_BATCH_SIZE:
                 try:
-                    self._processing_queue.task_done()
-                except ValueError:
-                    pass
+                    batch.append(self._processing_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            for index, (export_path, export_id) in enumerate(batch):
+                # Backpressure: wait for a free slot before starting the next export
+                try:
+                    await self._ingestion_semaphore.acquire()
+                except asyncio.CancelledError:
+                    # Stopped while waiting: the rest of the batch never started
+                    self._requeue_unstarted(batch[index:])
+                    raise
+                self._start_export(export_path, export_id, worker_id)
         
         logger.info(f"Export processor worker {worker_id} stopped")
 
+    def _start_export(self, export_path: Path, export_id: str, worker_id: int) -> asyncio.Task:
+        """Start processing a dequeued export in the ingestion slot acquired for it.
+        
+        Args:
+            export_path: Path to export directory
+            export_id: Unique export identifier
+            worker_id: Identifier of the worker starting the export
+            
+        Returns:
+            The export task; _finish_export_task cleans up after it
+        """
+        task = asyncio.create_task(self._process_one(export_path, export_id, worker_id))
+        self._inflight_tasks.add(task)
+        task.add_done_callback(partial(self._finish_export_task, (export_path, export_id)))
+        return task
+
+    def _requeue_unstarted(self, items: List[tuple]) -> None:
+        """Hand dequeued but unstarted exports back to the queue.
+        
+        They keep their in-flight IDs, and each get() is matched by a
+        task_done() so queue.join() still settles.
+        
+        Args:
+            items: (export_path, export_id) pairs taken off the queue
+        """
+        for item in items:
+            self._processing_queue.put_nowait(item)
+            self._processing_queue.task_done()
+
+    def _finish_export_task(self, item: tuple, task: asyncio.Task) -> None:
+        """Release an export task's slot and queue entry once it is done.
+        
+        Runs as a done callback, so it also covers a task cancelled before
+        its first step, when none of _process_one (not even its finally)
+        has run.
+        
+        Args:
+            item: (export_path, export_id) pair the task was started for
+            task: The finished export task
+        """
+        self._inflight_tasks.discard(task)
+        self._ingestion_semaphore.release()
+        
+        export_id = item[1]
+        # _process_one records the ID before its first await, so its absence
+        # means the export never started; it was new when queued
+        if task.cancelled() and export_id not in self._processed_exports:
+            self._requeue_unstarted([item])
+        else:
+            self._inflight_ids.discard(export_id)
+            self._processing_queue.task_done()
+
+    async def _process_one(self, export_path: Path, export_id: str, worker_id: int):
+        """Process a single dequeued export.
+        
+        Args:
+            export_path: Path to export directory
+            export_id: Unique export identifier
+            worker_id: Identifier of the worker handling the export
+        """
+        try:
+            # Mark as processed to avoid duplicates
+            self._processed_exports.add(export_id)
+            
+            logger.info(f"Worker {worker_id} processing export: {export_path}")
+            
+            # Trigger callback
+            if self._on_export_started:
+                self._on_export_started(export_path)
+            
+            # Process the export directory
+            start_time = time.time()
+            result = await self.ingestion_service.process_export_directory(
+                export_path,
+                validate_files=True,
+                force_reingest=False
+            )
+            
+            processing_time = time.time() - start_time
+            result["worker_id"] = worker_id
+            result["total_processing_time"] = processing_time
+            
+            # Create processing result
+            processing_result = ProcessingResult(
+                export_path=export_path,
+                status=result.get("status", IngestionStatus.FAILED),
+                result=result
+            )
+            
+            # Store result
+            self._processing_results.append(processing_result)
+            
+            # Trigger completion callback
+            if processing_result.status == IngestionStatus.SUCCESS:
+                logger.info(f"Worker {worker_id} successfully processed: {export_path}")
+                await self._record_processed(export_path, export_id)
+                if self._on_export_completed:
+                    self._on_export_completed(processing_result)
+            else:
+                logger.error(f"Worker {worker_id} failed to process: {export_path}")
+                if self._on_export_failed:
+                    error_msg = result.get("error", "Unknown processing error")
+                    self._on_export_failed(export_path, error_msg)
+                    
+        except Exception as e:
+            logger.error(f"Error in export processor worker {worker_id}: {e}")
+
     async def start_monitoring(self) -> Dict[str, Any]:
         """Start file monitoring and processing.
         
@@ -337,14 +838,12 @@ class FileMonitor:
             # Ensure export directory exists
             self.export_directory.mkdir(parents=True, exist_ok=True)
             
+            # Filesystem events arrive on the observer thread and are handed to this loop
+            self._loop = asyncio.get_running_loop()
+            
             # Setup watchdog observer
             self._handler = ExportDirectoryHandler(self)
-            self._observer = Observer()
-            self._observer.schedule(
-                self._handler, 
-                str(self.export_directory), 
-                recursive=True
-            )
+            self._observer = self._create_observer()
             
             # Start processing workers
             self._processor_tasks = []
@@ -400,13 +899,16 @@ class FileMonitor:
                 self._observer.join(timeout=5.0)
                 self._observer = None
             
-            # Cancel processor tasks
-            for task in self._processor_tasks:
+            self._cancel_pending_exports()
+            
+            # Cancel processor tasks and the exports they have in flight
+            tasks = [*self._processor_tasks, *self._inflight_tasks]
+            for task in tasks:
                 task.cancel()
             
             # Wait for tasks to complete
-            if self._processor_tasks:
-                await asyncio.gather(*self._processor_tasks, return_exceptions=True)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
             
             self._processor_tasks = []
             self._handler = None
@@ -450,6 +952,8 @@ class FileMonitor:
                 self._observer.join(timeout=5.0)
                 self._observer = None
             
+            self._cancel_pending_exports()
+            
             self._status = MonitoringStatus.PAUSED
             
             result = {
@@ -486,13 +990,9 @@ class FileMonitor:
         
         try:
             # Restart observer
+            self._loop = asyncio.get_running_loop()
             self._handler = ExportDirectoryHandler(self)
-            self._observer = Observer()
-            self._observer.schedule(
-                self._handler, 
-                str(self.export_directory), 
-                recursive=True
-            )
+            self._observer = self._create_observer()
             self._observer.start()
             
             self._status = MonitoringStatus.RUNNING
@@ -532,12 +1032,25 @@ class FileMonitor:
                     "timestamp": datetime.now().isoformat()
                 }
             
-            # Find potential export directories
+            # Find potential export directories. scandir returns the entry type
+            # with the listing, so non-directories are skipped without a stat()
+            with os.scandir(self.export_directory) as entries:
+                candidates = [
+                    entry for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+            
             discovered_exports = []
-            for item in self.export_directory.iterdir():
-                if item.is_dir() and self._is_valid_export_directory(item):
-                    export_id = self._get_export_id(item)
-                    if export_id not in self._processed_exports:
+            for entry in candidates:
+                item = Path(entry.path)
+                # DirEntry caches its stat, and the manifest stat from validation
+                # feeds the fingerprint, so each export is stat'ed once per file
+                manifest_stat = self._validate_export(item, entry.stat())
+                if manifest_stat is not None:
+                    export_id = self._get_export_id(item, manifest_stat)
+                    # Copies of the same export share an ID; queue only the first
+                    if not self._is_already_processed(export_id):
+                        self._inflight_ids.add(export_id)
                         discovered_exports.append(item)
                         await self._processing_queue.put((item, export_id))
             
@@ -568,6 +1081,8 @@ class FileMonitor:
         Returns:
             Dict containing monitoring status
         """
+        # Single pass over the (up to max_history long) result buffer
+        status_counts = Counter(result.status for result in self._processing_results)
         return {
             "status": self._status,
             "is_running": self.is_running,
@@ -575,16 +1090,22 @@ class FileMonitor:
             "processed_exports_count": len(self._processed_exports),
             "queue_size": self._processing_queue.qsize(),
             "active_processors": len([t for t in self._processor_tasks if not t.done()]),
+            "inflight_exports": len(self._inflight_tasks),
             "total_results": len(self._processing_results),
-            "successful_results": len([r for r in self._processing_results if r.status == IngestionStatus.SUCCESS]),
-            "failed_results": len([r for r in self._processing_results if r.status == IngestionStatus.FAILED]),
+            "successful_results": status_counts[IngestionStatus.SUCCESS],
+            "failed_results": status_counts[IngestionStatus.FAILED],
             "timestamp": datetime.now().isoformat()
         }
 
-    def clear_processing_history(self) -> None:
-        """Clear processing history and results."""
+    async def clear_processing_history(self) -> None:
+        """Clear processing history and results, including the persisted state."""
         self._processed_exports.clear()
         self._processing_results.clear()
+        self._validity_cache.clear()
+        self._fingerprint_cache.clear()
+        if self._processed_meta:
+            self._processed_meta.clear()
+            await self._persist_state()
         logger.info("Processing history cleared")
 
     async def __aenter__(self):
@@ -21,12 +21,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
 import hashlib
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Callable
 from datetime import datetime
 
+from pydantic import ValidationError
+from pydantic_core import from_json
+
 from .config import Settings
 from .graphiti_client import GraphitiClient, GraphitiConnectionError, GraphitiValidationError
 from .models import (
@@ -77,19 +79,20 @@ class IngestionService:
         logger.info("IngestionService initialized")
 
     def _calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of a file.
+        """Calculate a BLAKE2b-128 checksum of a file.
+        
+        The checksum only guards file integrity; BLAKE2b is faster than MD5 on
+        64-bit CPUs and keeps the same 32-character hex length.
         
         Args:
             file_path: Path to the file
             
         Returns:
-            MD5 checksum as hex string
+            BLAKE2b-128 checksum as hex string
         """
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # file_digest runs the read/update loop in C
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
 
     def _load_manifest(self, export_dir: Path) -> ExportManifest:
         """Load and validate export manifest.
@@ -109,17 +112,16 @@ class IngestionService:
             raise ManifestValidationError(f"Manifest file not found: {manifest_path}")
         
         try:
-            with open(manifest_path, 'r') as f:
-                manifest_data = json.load(f)
-            
-            # Parse and validate manifest
-            manifest = ExportManifest.model_validate(manifest_data)
+            # Parse and validate in one pass with pydantic's native JSON parser
+            manifest = ExportManifest.model_validate_json(manifest_path.read_bytes())
             
             logger.info(f"Loaded manifest: {manifest.export_id} with {manifest.total_episodes} episodes")
             return manifest
             
-        except json.JSONDecodeError as e:
-            raise ManifestValidationError(f"Invalid JSON in manifest: {e}")
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise ManifestValidationError(f"Invalid JSON in manifest: {e}")
+            raise ManifestValidationError(f"Failed to parse manifest: {e}")
         except Exception as e:
             raise ManifestValidationError(f"Failed to parse manifest: {e}")
 
@@ -170,9 +172,11 @@ class IngestionService:
             file_size = file_path.stat().st_size
             checksum = self._calculate_file_checksum(file_path) if validate_checksum else None
             
-            # Load episode data
-            with open(file_path, 'r') as f:
-                episode_data = json.load(f)
+            # Load episode data (pydantic-core's JSON parser, straight from bytes)
+            try:
+                episode_data = from_json(file_path.read_bytes())
+            except ValueError as e:
+                raise IngestionError(f"Invalid JSON in episode file {file_path}: {e}") from e
             
             # Handle Dagster export format with episode_metadata and graphiti_episode sections
             if "episode_metadata" in episode_data and "graphiti_episode" in episode_data:
@@ -228,8 +232,8 @@ class IngestionService:
             
             return episode
             
-        except json.JSONDecodeError as e:
-            raise IngestionError(f"Invalid JSON in episode file {file_path}: {e}")
+        except IngestionError:
+            raise
         except Exception as e:
             raise IngestionError(f"Failed to load episode from {file_path}: {e}")
 
@@ -238,7 +242,7 @@ class IngestionService:
         
         Args:
             file_path: Path to file
-            expected_checksum: Expected MD5 checksum (if None, skip validation)
+            expected_checksum: Expected BLAKE2b-128 checksum (if None, skip validation)
             
         Returns:
             True if file is valid
@@ -342,8 +346,8 @@ class IngestionService:
             # Load and validate manifest
             manifest = self._load_manifest(export_dir)
             
-            # Discover episode files
-            episode_files = self._discover_episode_files(export_dir)
+            # Discover episode files (directory walk runs off the event loop)
+            episode_files = await asyncio.to_thread(self._discover_episode_files, export_dir)
             
             if not episode_files:
                 return {
@@ -42,7 +42,7 @@ class EpisodeMetadata(BaseModel):
     export_timestamp: datetime = Field(..., description="When the episode was exported from Dagster")
     file_path: Path = Field(..., description="Path to the episode JSON file")
     file_size: int = Field(..., ge=0, description="Size of the episode file in bytes")
-    checksum: Optional[str] = Field(None, description="MD5 checksum of the episode file")
+    checksum: Optional[str] = Field(None, description="BLAKE2b-128 checksum of the episode file")
     validation_status: IngestionStatus = Field(
         default=IngestionStatus.PENDING, 
         description="Current validation/ingestion status"
@@ -0,0 +1,40 @@
+"""Fixtures shared by tests/conftest.py and the sub-package conftests.
+
+The root conftest re-exports these, so they already apply to every test
+directory; sub-directories only override what differs.
+"""
+
+import os
+import shutil
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment(tmp_path_factory):
+    """Set test environment variables for the session and restore them afterwards."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("OPENAI_API_KEY", "test-key-12345")
+    mp.setenv("NEO4J_PASSWORD", "test-password")
+    mp.setenv("NEO4J_URI", "bolt://localhost:7687")
+    mp.setenv("NEO4J_USER", "neo4j")
+    mp.setenv("GRAPHITI_GROUP_ID", "test_group")
+    mp.setenv("LOG_LEVEL", "INFO")
+    mp.setenv("EXPORT_DIRECTORY", str(tmp_path_factory.mktemp("test_exports")))
+    mp.setenv("ENABLE_MONITORING", "false")  # Disable monitoring for tests
+    
+    yield
+    
+    mp.undo()
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, copying when linking is not possible (e.g. across devices).
+
+    Used as ``shutil.copytree(..., copy_function=link_or_copy)`` to clone
+    session-scoped fixture trees cheaply.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
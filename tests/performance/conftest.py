@@ -2,9 +2,14 @@
 
 import asyncio
 import pytest
+import shutil
+import sys
 import tempfile
 import json
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List, AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
@@ -12,16 +17,13 @@ from unittest.mock import AsyncMock, MagicMock
 import httpx
 import psutil
 
+if sys.platform != "win32":
+    import resource
+
 from src.pd_graphiti_service.config import Settings
+from src.pd_graphiti_service.graphiti_client import GraphitiClient
 from src.pd_graphiti_service.models import GraphitiEpisode, EpisodeMetadata, IngestionStatus
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async session-scoped fixtures."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+from tests._shared import link_or_copy
 
 
 @pytest.fixture(scope="session")
@@ -42,6 +44,18 @@ def performance_settings() -> Settings:
     )
 
 
+# Built once per session: spec introspection makes AsyncMock construction
+# expensive, so the fixture below hands out this instance and resets it.
+_MOCK_GRAPHITI_CLIENT = AsyncMock(spec=GraphitiClient)
+
+
+@pytest.fixture
+def mock_graphiti_client() -> Generator[AsyncMock, None, None]:
+    """Shared GraphitiClient mock, reset (including return values and side effects) after each test."""
+    yield _MOCK_GRAPHITI_CLIENT
+    _MOCK_GRAPHITI_CLIENT.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def mock_openai_responses():
     """Mock OpenAI responses to avoid API costs during load testing."""
@@ -51,23 +65,28 @@ def mock_openai_responses():
     }
 
 
-@pytest.fixture
-def sample_episode_data() -> Dict[str, Any]:
-    """Sample episode data for performance testing."""
-    return {
-        "episode_metadata": {
-            "gene_symbol": "SNCA",
-            "episode_type": "gene_profile", 
-            "export_timestamp": "2025-01-07T12:00:00Z"
-        },
-        "graphiti_episode": {
-            "name": "SNCA_gene_profile",
-            "episode_body": "SNCA (alpha-synuclein) is a protein that in humans is encoded by the SNCA gene. " * 50,  # Make it substantial
-            "source": "performance_test",
-            "source_description": "Generated episode for performance testing",
-            "group_id": "performance_test_group"
-        }
+_SAMPLE_EPISODE_DATA: Dict[str, Any] = {
+    "episode_metadata": {
+        "gene_symbol": "SNCA",
+        "episode_type": "gene_profile", 
+        "export_timestamp": "2025-01-07T12:00:00Z"
+    },
+    "graphiti_episode": {
+        "name": "SNCA_gene_profile",
+        "episode_body": "SNCA (alpha-synuclein) is a protein that in humans is encoded by the SNCA gene. " * 50,  # Make it substantial
+        "source": "performance_test",
+        "source_description": "Generated episode for performance testing",
+        "group_id": "performance_test_group"
     }
+}
+_SAMPLE_EPISODE_JSON = json.dumps(_SAMPLE_EPISODE_DATA).encode()
+_SAMPLE_FILE_SIZE = len(_SAMPLE_EPISODE_JSON)
+
+
+@pytest.fixture(scope="session")
+def sample_episode_data() -> Dict[str, Any]:
+    """Sample episode data for performance testing (shared, do not mutate)."""
+    return _SAMPLE_EPISODE_DATA
 
 
 @pytest.fixture 
@@ -78,7 +97,7 @@ def sample_episode(sample_episode_data) -> GraphitiEpisode:
         episode_type=sample_episode_data["episode_metadata"]["episode_type"],
         export_timestamp=sample_episode_data["episode_metadata"]["export_timestamp"],
         file_path=Path("/tmp/test_episode.json"),
-        file_size=len(json.dumps(sample_episode_data)),
+        file_size=_SAMPLE_FILE_SIZE,
         validation_status=IngestionStatus.PENDING
     )
     
@@ -93,26 +112,29 @@ def sample_episode(sample_episode_data) -> GraphitiEpisode:
     )
 
 
-@pytest.fixture
-def large_episode_batch(sample_episode_data) -> List[GraphitiEpisode]:
+@pytest.fixture(scope="session")
+def large_episode_batch() -> List[GraphitiEpisode]:
     """Generate a large batch of episodes for load testing."""
     episodes = []
     gene_symbols = ["SNCA", "LRRK2", "PARK7", "PINK1", "PRKN"] * 20  # 100 episodes
     episode_types = ["gene_profile", "gwas_evidence", "eqtl_evidence", "literature_evidence", "pathway_evidence"]
     
+    # model_construct skips pydantic validation; this is only safe here because
+    # the fixture generates known-good data. Do not copy into production code.
+    export_timestamp = datetime(2025, 1, 7, 12, 0, 0, tzinfo=timezone.utc)
     for i, gene in enumerate(gene_symbols):
         episode_type = episode_types[i % len(episode_types)]
         
-        metadata = EpisodeMetadata(
+        metadata = EpisodeMetadata.model_construct(
             gene_symbol=gene,
             episode_type=episode_type,
-            export_timestamp="2025-01-07T12:00:00Z",
+            export_timestamp=export_timestamp,
             file_path=Path(f"/tmp/test_episode_{i}.json"),
             file_size=1000 + i * 10,  # Varying sizes
             validation_status=IngestionStatus.PENDING
         )
         
-        episode = GraphitiEpisode(
+        episode = GraphitiEpisode.model_construct(
             episode_name=f"{gene}_{episode_type}_{i}",
             episode_body=f"Performance test episode for {gene} - {episode_type}. " + "Content. " * (50 + i),
             source="performance_test",
@@ -125,10 +147,10 @@ def large_episode_batch(sample_episode_data) -> List[GraphitiEpisode]:
     return episodes
 
 
-@pytest.fixture 
-def mock_export_directory(tmp_path, large_episode_batch) -> Path:
-    """Create a mock export directory with many episodes for testing."""
-    export_dir = tmp_path / "mock_export_20250107_120000"
+@pytest.fixture(scope="session")
+def session_export_dir(tmp_path_factory, large_episode_batch) -> Path:
+    """Build the pristine mock export directory once per session."""
+    export_dir = tmp_path_factory.mktemp("session_export") / "mock_export_20250107_120000"
     export_dir.mkdir()
     
     # Create episodes directory structure
@@ -178,6 +200,19 @@ def mock_export_directory(tmp_path, large_episode_batch) -> Path:
     return export_dir
 
 
+@pytest.fixture
+def mock_export_directory(tmp_path, session_export_dir) -> Path:
+    """Per-test mock export directory with many episodes for testing.
+
+    Files are hard-linked from the session tree, so tests that want to change
+    a file must replace it (write a new file and rename) rather than edit it
+    in place, otherwise the change leaks into the shared copy.
+    """
+    export_dir = tmp_path / session_export_dir.name
+    shutil.copytree(session_export_dir, export_dir, copy_function=link_or_copy)
+    return export_dir
+
+
 @pytest.fixture
 async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
     """HTTP client for API testing."""
@@ -185,88 +220,145 @@ async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
         yield client
 
 
+async def _bulk_post(
+    client: httpx.AsyncClient,
+    url: str,
+    payloads: List[Dict[str, Any]],
+    concurrency: int = 50
+) -> List[httpx.Response]:
+    """POST every payload to url with at most `concurrency` requests in flight.
+
+    Responses are returned in payload order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def post_one(payload: Dict[str, Any]) -> httpx.Response:
+        async with semaphore:
+            return await client.post(url, json=payload)
+    
+    return await asyncio.gather(*(post_one(payload) for payload in payloads))
+
+
 @pytest.fixture
-def performance_monitor():
-    """Monitor system performance during tests."""
-    class PerformanceMonitor:
-        def __init__(self):
-            self.start_time = None
-            self.end_time = None
-            self.start_memory = None
-            self.end_memory = None
-            self.start_cpu = None
-            self.end_cpu = None
-            self.process = psutil.Process()
-        
-        def start(self):
-            self.start_time = time.time()
-            self.start_memory = self.process.memory_info()
-            self.start_cpu = self.process.cpu_percent()
-        
-        def stop(self):
-            self.end_time = time.time()
-            self.end_memory = self.process.memory_info()
-            self.end_cpu = self.process.cpu_percent()
-        
-        @property
-        def duration(self) -> float:
-            if self.start_time and self.end_time:
-                return self.end_time - self.start_time
-            return 0.0
-        
-        @property
-        def memory_delta(self) -> int:
-            if self.start_memory and self.end_memory:
-                return self.end_memory.rss - self.start_memory.rss
-            return 0
-        
-        def get_stats(self) -> Dict[str, Any]:
-            return {
-                "duration": self.duration,
-                "memory_delta_mb": self.memory_delta / 1024 / 1024,
-                "start_memory_mb": self.start_memory.rss / 1024 / 1024 if self.start_memory else 0,
-                "end_memory_mb": self.end_memory.rss / 1024 / 1024 if self.end_memory else 0,
-                "start_cpu_percent": self.start_cpu,
-                "end_cpu_percent": self.end_cpu
-            }
+def bulk_post(http_client):
+    """Concurrent POST helper bound to the test HTTP client.
+
+    Usage: ``responses = await bulk_post(url, payloads, concurrency=50)``
+    """
+    async def _post(url: str, payloads: List[Dict[str, Any]], concurrency: int = 50) -> List[httpx.Response]:
+        return await _bulk_post(http_client, url, payloads, concurrency)
     
-    return PerformanceMonitor()
+    return _post
+
+
+def _sample_usage() -> tuple[int, float]:
+    """Return (peak RSS in bytes, user+system CPU seconds) for this process.
+
+    Uses a single getrusage() syscall where available; psutil is only used on
+    Windows, which has no ``resource`` module.
+    """
+    if sys.platform == "win32":
+        process = psutil.Process()
+        cpu_times = process.cpu_times()
+        return process.memory_info().rss, cpu_times.user + cpu_times.system
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    rss_scale = 1 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss * rss_scale, usage.ru_utime + usage.ru_stime
+
+
+@dataclass(slots=True)
+class PerfStats:
+    """Resource usage captured by :func:`perf_monitor`."""
+    start_ns: int = 0
+    end_ns: int = 0
+    start_memory: int = 0
+    end_memory: int = 0
+    cpu_time: float = 0.0
+    
+    @property
+    def duration(self) -> float:
+        """Elapsed wall time in seconds."""
+        return (self.end_ns - self.start_ns) / 1e9
+    
+    @property
+    def memory_delta(self) -> int:
+        return self.end_memory - self.start_memory
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "memory_delta_mb": self.memory_delta / 1024 / 1024,
+            "start_memory_mb": self.start_memory / 1024 / 1024,
+            "end_memory_mb": self.end_memory / 1024 / 1024,
+            "cpu_time_seconds": self.cpu_time
+        }
+
+
+@contextmanager
+def perf_monitor() -> Generator[PerfStats, None, None]:
+    """Measure wall time, peak memory and CPU time of the enclosed block.
+
+    The yielded stats are filled in when the block exits.
+    """
+    start_memory, start_cpu_time = _sample_usage()
+    stats = PerfStats(start_memory=start_memory)
+    stats.start_ns = time.perf_counter_ns()
+    try:
+        yield stats
+    finally:
+        stats.end_ns = time.perf_counter_ns()
+        stats.end_memory, end_cpu_time = _sample_usage()
+        stats.cpu_time = end_cpu_time - start_cpu_time
+
+
+@pytest.fixture
+def performance_monitor():
+    """Monitor system performance during tests.
+
+    Usage: ``with performance_monitor() as stats: ...`` then read ``stats``.
+    """
+    return perf_monitor
 
 
 @pytest.fixture
 def network_failure_simulator():
     """Simulate network failures for reliability testing."""
     class NetworkFailureSimulator:
-        def __init__(self):
-            self.original_methods = {}
+        """Build in-process httpx clients whose transport fails on every request.
+
+        Use the returned clients as async context managers; nothing global is
+        patched, so there is nothing to restore afterwards.
+        """
         
-        def simulate_connection_timeout(self, target_module, method_name, delay=5.0):
-            """Simulate connection timeout by adding delay."""
-            import time
-            original_method = getattr(target_module, method_name)
-            self.original_methods[f"{target_module.__name__}.{method_name}"] = original_method
-            
-            async def delayed_method(*args, **kwargs):
-                await asyncio.sleep(delay)
-                raise asyncio.TimeoutError("Simulated network timeout")
-            
-            setattr(target_module, method_name, delayed_method)
+        def __init__(self, base_url: str = "http://testserver"):
+            self.base_url = base_url
+        
+        def _client(self, handler) -> httpx.AsyncClient:
+            return httpx.AsyncClient(
+                transport=httpx.MockTransport(handler),
+                base_url=self.base_url
+            )
         
-        def simulate_connection_error(self, target_module, method_name):
-            """Simulate connection error."""
-            original_method = getattr(target_module, method_name)
-            self.original_methods[f"{target_module.__name__}.{method_name}"] = original_method
+        def simulate_connection_timeout(self, delay: float = 0.0) -> httpx.AsyncClient:
+            """Client whose requests time out, optionally after a delay."""
+            async def handler(request: httpx.Request) -> httpx.Response:
+                if delay:
+                    await asyncio.sleep(delay)
+                raise httpx.ConnectTimeout("Simulated network timeout", request=request)
             
-            async def error_method(*args, **kwargs):
-                raise ConnectionError("Simulated connection error")
+            return self._client(handler)
+        
+        def simulate_connection_error(self) -> httpx.AsyncClient:
+            """Client whose requests fail to connect."""
+            def handler(request: httpx.Request) -> httpx.Response:
+                raise httpx.ConnectError("Simulated connection error", request=request)
             
-            setattr(target_module, method_name, error_method)
+            return self._client(handler)
         
-        def restore_all(self):
-            """Restore all original methods."""
-            for key, original_method in self.original_methods.items():
-                module_name, method_name = key.rsplit('.', 1)
-                # This is a simplified restore - in practice you'd need more sophisticated module resolution
-                pass
+        def simulate_error_response(self, status_code: int = 504) -> httpx.AsyncClient:
+            """Client whose requests all return the given error status."""
+            return self._client(lambda request: httpx.Response(status_code))
     
-    return NetworkFailureSimulator()
\ No newline at end of file
+    return NetworkFailureSimulator()
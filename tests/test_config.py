@@ -74,42 +74,46 @@ class TestSettings:
         assert isinstance(settings.export_directory, Path)
         assert str(settings.export_directory) == "/test/path"
 
-    def test_log_level_validation(self, monkeypatch):
-        """Test log level validation."""
+    @pytest.mark.parametrize("level", ["DEBUG", "info", "Warning", "ERROR", "critical"])
+    def test_log_level_validation(self, monkeypatch, level):
+        """Test valid log levels are accepted and normalised to upper case."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
-        
-        # Valid log levels should work
-        for level in ["DEBUG", "info", "Warning", "ERROR", "critical"]:
-            monkeypatch.setenv("LOG_LEVEL", level)
-            settings = Settings.from_env()
-            assert settings.log_level == level.upper()
+        monkeypatch.setenv("LOG_LEVEL", level)
+
+        settings = Settings.from_env()
+        assert settings.log_level == level.upper()
 
-        # Invalid log level should fail
+    def test_log_level_validation_invalid(self, monkeypatch):
+        """Test invalid log level is rejected."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
         monkeypatch.setenv("LOG_LEVEL", "INVALID")
+
         with pytest.raises(ValidationError):
             Settings.from_env()
 
-    def test_neo4j_uri_validation(self, monkeypatch):
-        """Test Neo4j URI validation."""
+    @pytest.mark.parametrize("uri", [
+        "bolt://localhost:7687",
+        "neo4j://localhost:7687",
+        "bolt+s://localhost:7687",
+        "neo4j+s://localhost:7687",
+    ])
+    def test_neo4j_uri_validation(self, monkeypatch, uri):
+        """Test valid Neo4j URIs are accepted."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
-        
-        # Valid URIs should work
-        valid_uris = [
-            "bolt://localhost:7687",
-            "neo4j://localhost:7687",
-            "bolt+s://localhost:7687",
-            "neo4j+s://localhost:7687",
-        ]
-        
-        for uri in valid_uris:
-            monkeypatch.setenv("NEO4J_URI", uri)
-            settings = Settings.from_env()
-            assert settings.neo4j_uri == uri
+        monkeypatch.setenv("NEO4J_URI", uri)
+
+        settings = Settings.from_env()
+        assert settings.neo4j_uri == uri
 
-        # Invalid URI should fail
+    def test_neo4j_uri_validation_invalid(self, monkeypatch):
+        """Test invalid Neo4j URI scheme is rejected."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
         monkeypatch.setenv("NEO4J_URI", "invalid://localhost:7687")
+
         with pytest.raises(ValidationError):
             Settings.from_env()
 
@@ -2,12 +2,19 @@
 
 import asyncio
 import json
+import os
+import shutil
 import tempfile
+import threading
 import pytest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import DirCreatedEvent, FileCreatedEvent, DirMovedEvent, FileMovedEvent
+
 from pd_graphiti_service.config import Settings
 from pd_graphiti_service.ingestion_service import IngestionService
 from pd_graphiti_service.file_monitor import (
@@ -15,14 +22,18 @@ from pd_graphiti_service.file_monitor import (
     MonitoringStatus,
     ProcessingResult,
     ExportDirectoryHandler,
-    create_file_monitor
+    create_file_monitor,
+    _filesystem_type,
+    _select_observer,
+    _manifest_digest
 )
 from pd_graphiti_service.models import IngestionStatus
+from tests._shared import link_or_copy
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings for testing."""
+    """Create mock settings for testing (validated once per module)."""
     return Settings(
         openai_api_key="test-key",
         neo4j_password="test-password",
@@ -33,10 +44,17 @@ def mock_settings():
     )
 
 
+@pytest.fixture(scope="module")
+def _ingestion_service_template():
+    """Shared AsyncMock so the IngestionService spec is introspected once per module."""
+    return AsyncMock(spec=IngestionService)
+
+
 @pytest.fixture
-def mock_ingestion_service():
+def mock_ingestion_service(_ingestion_service_template):
     """Create mock IngestionService."""
-    service = AsyncMock(spec=IngestionService)
+    service = _ingestion_service_template
+    service.reset_mock(return_value=True, side_effect=True)
     
     # Mock successful export directory processing
     service.process_export_directory.return_value = {
@@ -49,6 +67,26 @@ def mock_ingestion_service():
     return service
 
 
+@pytest.fixture
+def mock_observer(monkeypatch):
+    """Make _select_observer hand the monitor a Mock observer and return that observer."""
+    observer = Mock()
+    monkeypatch.setattr(
+        "pd_graphiti_service.file_monitor._select_observer",
+        Mock(return_value=Mock(return_value=observer))
+    )
+    return observer
+
+
+@pytest.fixture(autouse=True)
+async def no_leaked_tasks():
+    """Fail tests that leave tasks running on the shared session event loop."""
+    before = asyncio.all_tasks()
+    yield
+    leaked = asyncio.all_tasks() - before - {asyncio.current_task()}
+    assert not leaked, f"Test left {len(leaked)} task(s) running: {leaked}"
+
+
 @pytest.fixture
 def temp_export_directory():
     """Create temporary export directory for testing."""
@@ -58,7 +96,7 @@ def temp_export_directory():
         yield export_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_export_data():
     """Create sample export directory with manifest and episodes."""
     return {
@@ -106,6 +144,24 @@ def create_sample_export(export_dir: Path, export_name: str, sample_data: dict):
     return export_path
 
 
+@pytest.fixture(scope="session")
+def canonical_export(tmp_path_factory, sample_export_data):
+    """Sample export written once per session; tests clone it rather than rebuild it."""
+    return create_sample_export(tmp_path_factory.mktemp("canonical"), "canonical_export", sample_export_data)
+
+
+@pytest.fixture
+def clone_sample_export(canonical_export):
+    """Return a helper that clones the canonical sample export into a directory.
+    
+    Files are hard-linked, so tests that need to modify an export's files
+    should build it with create_sample_export instead.
+    """
+    def _clone(export_dir: Path, export_name: str) -> Path:
+        return Path(shutil.copytree(canonical_export, export_dir / export_name, copy_function=link_or_copy))
+    return _clone
+
+
 class TestMonitoringStatus:
     """Test MonitoringStatus enum."""
     
@@ -144,6 +200,39 @@ class TestProcessingResult:
         assert result_dict["status"] == status
         assert result_dict["result"] == result_data
         assert "timestamp" in result_dict
+        
+        # Slotted: no per-instance __dict__
+        assert not hasattr(result, "__dict__")
+
+
+class TestObserverSelection:
+    """Test choosing the watchdog observer for the export directory."""
+    
+    def test_select_observer_local_filesystem(self):
+        """Test local directories use the native observer."""
+        with patch('pd_graphiti_service.file_monitor._is_network_path', return_value=False):
+            factory = _select_observer(Path("/test/exports"), 30.0)
+        
+        assert factory is Observer
+
+    def test_select_observer_network_filesystem(self):
+        """Test network mounts fall back to polling at the configured interval."""
+        with patch('pd_graphiti_service.file_monitor._is_network_path', return_value=True):
+            factory = _select_observer(Path("/mnt/nfs/exports"), 12.5)
+        
+        observer = factory()
+        assert isinstance(observer, PollingObserver)
+        assert observer.timeout == 12.5
+
+    def test_filesystem_type_longest_mount_wins(self):
+        """Test the most specific mount point determines the filesystem type."""
+        mounts = (
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "server:/exports /mnt/nfs nfs4 rw 0 0\n"
+        )
+        with patch.object(Path, "read_text", return_value=mounts):
+            assert _filesystem_type(Path("/mnt/nfs/exports")) == "nfs4"
+            assert _filesystem_type(Path("/home/user")) == "ext4"
 
 
 class TestExportDirectoryHandler:
@@ -156,41 +245,119 @@ class TestExportDirectoryHandler:
         
         assert handler.file_monitor == file_monitor
 
-    @patch('asyncio.create_task')
-    def test_on_created_directory_event(self, mock_create_task, mock_settings, mock_ingestion_service):
+    def test_on_created_directory_event(self, mock_settings, mock_ingestion_service):
         """Test handling directory creation events."""
         file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._schedule_export = Mock()
         handler = ExportDirectoryHandler(file_monitor)
         
         # Mock directory creation event
         event = Mock()
         event.src_path = "/test/new_export"
+        event.is_directory = True
         
-        # Patch isinstance to return True for DirCreatedEvent
-        with patch('pd_graphiti_service.file_monitor.isinstance') as mock_isinstance:
-            mock_isinstance.return_value = True
-            
-            handler.on_created(event)
-            
-            mock_create_task.assert_called_once()
+        handler.on_created(event)
+        
+        file_monitor._schedule_export.assert_called_once_with(Path("/test/new_export"))
 
-    @patch('asyncio.create_task')
-    def test_on_created_manifest_file_event(self, mock_create_task, mock_settings, mock_ingestion_service):
+    def test_on_created_manifest_file_event(self, mock_settings, mock_ingestion_service):
         """Test handling manifest.json creation events."""
         file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._schedule_export = Mock()
         handler = ExportDirectoryHandler(file_monitor)
         
         # Mock file creation event for manifest.json
         event = Mock()
         event.src_path = "/test/export/manifest.json"
+        event.is_directory = False
         
-        # Patch isinstance to return False for DirCreatedEvent and True for FileCreatedEvent
-        with patch('pd_graphiti_service.file_monitor.isinstance') as mock_isinstance:
-            mock_isinstance.side_effect = lambda obj, cls: cls.__name__ == 'FileCreatedEvent'
-            
-            handler.on_created(event)
-            
-            mock_create_task.assert_called_once()
+        handler.on_created(event)
+        
+        file_monitor._schedule_export.assert_called_once_with(Path("/test/export"))
+
+    def test_on_created_ignores_other_files(self, mock_settings, mock_ingestion_service):
+        """Test that non-manifest file creation events are ignored."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._schedule_export = Mock()
+        handler = ExportDirectoryHandler(file_monitor)
+        
+        handler.on_created(FileCreatedEvent("/test/export/episodes/gene_profile/SNCA.json"))
+        handler.on_created(FileCreatedEvent("/test/export/old_manifest.json"))
+        
+        file_monitor._schedule_export.assert_not_called()
+
+    def test_on_moved_directory_event(self, mock_settings, mock_ingestion_service):
+        """Test that a directory renamed into the export root is scheduled."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._schedule_export = Mock()
+        handler = ExportDirectoryHandler(file_monitor)
+        
+        handler.on_moved(DirMovedEvent("/test/.staging_export", "/test/new_export"))
+        handler.on_moved(FileMovedEvent("/test/export/manifest.json.tmp", "/test/export/manifest.json"))
+        handler.on_moved(FileMovedEvent("/test/export/a.tmp", "/test/export/a.json"))
+        
+        assert file_monitor._schedule_export.call_args_list == [
+            ((Path("/test/new_export"),),),
+            ((Path("/test/export"),),),
+        ]
+
+    def test_observer_reports_renamed_export(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test the filtered native observer still delivers a staged-and-renamed export."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        scheduled = threading.Event()
+        file_monitor._schedule_export = Mock(side_effect=lambda path: scheduled.set())
+        file_monitor._handler = ExportDirectoryHandler(file_monitor)
+        
+        staging = temp_export_directory.parent / "staging_export"
+        staging.mkdir()
+        
+        observer = file_monitor._create_observer()
+        observer.start()
+        try:
+            staging.rename(temp_export_directory / "new_export")
+            assert scheduled.wait(timeout=5.0)
+        finally:
+            observer.stop()
+            observer.join(timeout=5.0)
+        
+        file_monitor._schedule_export.assert_called_with(temp_export_directory / "new_export")
+
+    async def test_on_created_burst_is_coalesced(self, mock_settings, mock_ingestion_service):
+        """Test that a directory event and its manifest event queue one export."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._loop = asyncio.get_running_loop()
+        file_monitor._enqueue_export = Mock()
+        handler = ExportDirectoryHandler(file_monitor)
+        
+        with patch('pd_graphiti_service.file_monitor._EVENT_DEBOUNCE_SECONDS', 0.05):
+            handler.on_created(DirCreatedEvent("/test/export"))
+            handler.on_created(FileCreatedEvent("/test/export/manifest.json"))
+            await asyncio.sleep(0.2)
+        
+        file_monitor._enqueue_export.assert_called_once_with(Path("/test/export"))
+        assert file_monitor._pending_exports == {}
+
+    def test_on_created_burst_wakes_loop_once(self, mock_settings, mock_ingestion_service):
+        """Test that a burst of events schedules a single handoff to the loop."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        file_monitor._loop = Mock()
+        file_monitor._loop.is_closed.return_value = False
+        handler = ExportDirectoryHandler(file_monitor)
+        
+        for i in range(5):
+            handler.on_created(DirCreatedEvent(f"/test/export_{i}"))
+        
+        file_monitor._loop.call_soon_threadsafe.assert_called_once_with(file_monitor._drain_event_backlog)
+        assert len(file_monitor._event_backlog) == 5
+
+    def test_on_created_without_running_monitor(self, mock_settings, mock_ingestion_service):
+        """Test that events are dropped when no event loop is attached."""
+        file_monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        handler = ExportDirectoryHandler(file_monitor)
+        
+        handler.on_created(DirCreatedEvent("/test/export"))
+        
+        assert file_monitor._pending_exports == {}
 
 
 class TestFileMonitor:
@@ -242,7 +409,7 @@ class TestFileMonitor:
         assert monitor._on_export_completed == on_completed
         assert monitor._on_export_failed == on_failed
 
-    def test_is_valid_export_directory(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+    def test_is_valid_export_directory(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
         """Test export directory validation."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
@@ -256,13 +423,93 @@ class TestFileMonitor:
         assert not monitor._is_valid_export_directory(empty_dir)
         
         # Test valid export directory
-        export_path = create_sample_export(temp_export_directory, "valid_export", sample_export_data)
+        export_path = clone_sample_export(temp_export_directory, "valid_export")
+        assert monitor._is_valid_export_directory(export_path)
+
+    async def test_is_valid_export_directory_cached(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test repeat validations of an unchanged export are served from cache."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        export_path = clone_sample_export(temp_export_directory, "cached_export")
+        
+        with patch.object(monitor, "_contains_episodes", wraps=monitor._contains_episodes) as mock_contains:
+            assert monitor._is_valid_export_directory(export_path)
+            assert monitor._is_valid_export_directory(export_path)
+            
+            mock_contains.assert_called_once_with(export_path)
+        
+        await monitor.clear_processing_history()
+        assert len(monitor._validity_cache) == 0
+
+    def test_is_valid_export_directory_cache_invalidated(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+        """Test cached invalid result is refreshed once episodes appear."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        
+        # Manifest written before the episodes directory
+        export_path = temp_export_directory / "partial_export"
+        export_path.mkdir()
+        (export_path / "manifest.json").write_text(json.dumps(sample_export_data["manifest"]))
+        assert not monitor._is_valid_export_directory(export_path)
+        
+        (export_path / "episodes").mkdir()
         assert monitor._is_valid_export_directory(export_path)
 
-    def test_get_export_id(self, mock_settings, mock_ingestion_service, temp_export_directory):
+    def test_get_export_id(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
         """Test export ID generation."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
+        export_path = create_sample_export(temp_export_directory, "test_export", sample_export_data)
+        
+        export_id = monitor._get_export_id(export_path)
+        
+        # Test consistency
+        export_id2 = monitor._get_export_id(export_path)
+        assert export_id == export_id2
+        
+        # Same manifest content under another name and parent -> same ID
+        (temp_export_directory / "restaged").mkdir()
+        copy_path = create_sample_export(temp_export_directory / "restaged", "renamed_export", sample_export_data)
+        assert monitor._get_export_id(copy_path) == export_id
+        
+        # Different manifest content -> different ID
+        changed_data = {**sample_export_data, "manifest": {**sample_export_data["manifest"], "checksum": "changed"}}
+        changed_path = create_sample_export(temp_export_directory, "changed_export", changed_data)
+        assert monitor._get_export_id(changed_path) != export_id
+
+    def test_get_export_id_reuses_scandir_stat(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test that IDs computed from DirEntry/validation stats match fresh ones."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        export_path = clone_sample_export(temp_export_directory, "test_export")
+        
+        with os.scandir(temp_export_directory) as entries:
+            entry = next(entries)
+        
+        manifest_stat = monitor._validate_export(export_path, entry.stat())
+        assert manifest_stat is not None
+        assert manifest_stat.st_ino == (export_path / "manifest.json").stat().st_ino
+        
+        # Stable across repeat calls with the same stat, and equal to a fresh computation
+        assert monitor._get_export_id(export_path, manifest_stat) == monitor._get_export_id(export_path, manifest_stat)
+        assert monitor._get_export_id(export_path, manifest_stat) == monitor._get_export_id(export_path)
+
+    def test_get_export_id_large_manifest(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+        """Test that mmap-hashed large manifests fingerprint like small ones."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        
+        large_data = {**sample_export_data, "manifest": {**sample_export_data["manifest"], "genes": ["SNCA"] * 5000}}
+        export_path = create_sample_export(temp_export_directory, "large_export", large_data)
+        manifest_path = export_path / "manifest.json"
+        manifest_size = manifest_path.stat().st_size
+        assert manifest_size >= 16384
+        
+        expected = _manifest_digest(manifest_path, 0)  # Forces the read() path
+        
+        assert _manifest_digest(manifest_path, manifest_size) == expected
+        assert monitor._get_export_id(export_path) == expected
+
+    def test_get_export_id_without_manifest(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test export ID falls back to name and mtime when there is no manifest."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        
         test_dir = temp_export_directory / "test_export"
         test_dir.mkdir()
         
@@ -270,31 +517,23 @@ class TestFileMonitor:
         
         assert "test_export" in export_id
         assert "_" in export_id  # Contains timestamp
-        
-        # Test consistency
-        export_id2 = monitor._get_export_id(test_dir)
-        assert export_id == export_id2
 
-    @pytest.mark.asyncio
-    async def test_process_new_export_async_valid(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+    def test_enqueue_export_valid(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
         """Test processing new export directory."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
         # Create valid export
-        export_path = create_sample_export(temp_export_directory, "new_export", sample_export_data)
+        export_path = clone_sample_export(temp_export_directory, "new_export")
         
-        # Mock queue operations
-        monitor._processing_queue = AsyncMock()
-        
-        await monitor._process_new_export_async(export_path)
+        assert monitor._enqueue_export(export_path)
         
         # Verify export was queued
-        monitor._processing_queue.put.assert_called_once()
-        call_args = monitor._processing_queue.put.call_args[0][0]
-        assert call_args[0] == export_path
+        assert monitor._processing_queue.qsize() == 1
+        queued_path, queued_id = monitor._processing_queue.get_nowait()
+        assert queued_path == export_path
+        assert queued_id == monitor._get_export_id(export_path)
 
-    @pytest.mark.asyncio
-    async def test_process_new_export_async_invalid(self, mock_settings, mock_ingestion_service, temp_export_directory):
+    def test_enqueue_export_invalid(self, mock_settings, mock_ingestion_service, temp_export_directory):
         """Test processing invalid export directory."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
@@ -302,46 +541,45 @@ class TestFileMonitor:
         invalid_export = temp_export_directory / "invalid_export"
         invalid_export.mkdir()
         
-        # Mock queue operations
-        monitor._processing_queue = AsyncMock()
-        
-        await monitor._process_new_export_async(invalid_export)
+        assert not monitor._enqueue_export(invalid_export)
         
         # Verify export was not queued
-        monitor._processing_queue.put.assert_not_called()
+        assert monitor._processing_queue.empty()
 
-    @pytest.mark.asyncio
-    async def test_process_new_export_async_already_processed(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+    def test_duplicate_enqueue_suppressed(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test that an export already waiting in the queue is not queued again."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        export_path = clone_sample_export(temp_export_directory, "new_export")
+        
+        assert monitor._enqueue_export(export_path)
+        assert not monitor._enqueue_export(export_path)
+        
+        assert monitor._processing_queue.qsize() == 1
+        assert monitor._get_export_id(export_path) in monitor._inflight_ids
+
+    def test_enqueue_export_already_processed(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
         """Test processing already processed export."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
         # Create valid export
-        export_path = create_sample_export(temp_export_directory, "processed_export", sample_export_data)
+        export_path = clone_sample_export(temp_export_directory, "processed_export")
         
         # Mark as already processed
         export_id = monitor._get_export_id(export_path)
         monitor._processed_exports.add(export_id)
         
-        # Mock queue operations
-        monitor._processing_queue = AsyncMock()
-        
-        await monitor._process_new_export_async(export_path)
+        assert not monitor._enqueue_export(export_path)
         
         # Verify export was not queued
-        monitor._processing_queue.put.assert_not_called()
+        assert monitor._processing_queue.empty()
 
-    @pytest.mark.asyncio
-    async def test_start_monitoring_success(self, mock_settings, mock_ingestion_service, temp_export_directory):
+    async def test_start_monitoring_success(self, mock_settings, mock_ingestion_service, temp_export_directory, mock_observer):
         """Test successful monitoring start."""
         # Use temp directory for testing
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         
-        with patch('pd_graphiti_service.file_monitor.Observer') as mock_observer_class:
-            mock_observer = Mock()
-            mock_observer_class.return_value = mock_observer
-            
-            result = await monitor.start_monitoring()
-            
+        result = await monitor.start_monitoring()
+        try:
             assert result["status"] == "started"
             assert "File monitoring started successfully" in result["message"]
             assert monitor.status == MonitoringStatus.RUNNING
@@ -349,9 +587,14 @@ class TestFileMonitor:
             
             # Verify observer was configured and started
             mock_observer.schedule.assert_called_once()
+            assert mock_observer.schedule.call_args.kwargs["event_filter"] == [
+                DirCreatedEvent, FileCreatedEvent, DirMovedEvent, FileMovedEvent
+            ]
             mock_observer.start.assert_called_once()
+        finally:
+            # The workers would otherwise outlive the test on the shared session loop
+            await monitor.stop_monitoring()
 
-    @pytest.mark.asyncio
     async def test_start_monitoring_already_running(self, mock_settings, mock_ingestion_service):
         """Test starting monitoring when already running."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
@@ -362,21 +605,20 @@ class TestFileMonitor:
         assert result["status"] == "already_running"
         assert "already running" in result["message"]
 
-    @pytest.mark.asyncio
-    async def test_start_monitoring_error(self, mock_settings, mock_ingestion_service):
+    async def test_start_monitoring_error(self, mock_settings, mock_ingestion_service, monkeypatch):
         """Test monitoring start error."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
+        monkeypatch.setattr(
+            "pd_graphiti_service.file_monitor._select_observer",
+            Mock(return_value=Mock(side_effect=Exception("Observer error")))
+        )
         
-        with patch('pd_graphiti_service.file_monitor.Observer') as mock_observer_class:
-            mock_observer_class.side_effect = Exception("Observer error")
-            
-            result = await monitor.start_monitoring()
-            
-            assert result["status"] == "error"
-            assert "Failed to start file monitoring" in result["error"]
-            assert monitor.status == MonitoringStatus.ERROR
+        result = await monitor.start_monitoring()
+        
+        assert result["status"] == "error"
+        assert "Failed to start file monitoring" in result["error"]
+        assert monitor.status == MonitoringStatus.ERROR
 
-    @pytest.mark.asyncio
     async def test_stop_monitoring_success(self, mock_settings, mock_ingestion_service, temp_export_directory):
         """Test successful monitoring stop."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
@@ -413,7 +655,6 @@ class TestFileMonitor:
         assert mock_task1.cancelled()
         assert mock_task2.cancelled()
 
-    @pytest.mark.asyncio
     async def test_stop_monitoring_already_stopped(self, mock_settings, mock_ingestion_service):
         """Test stopping monitoring when already stopped."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
@@ -423,7 +664,6 @@ class TestFileMonitor:
         assert result["status"] == "already_stopped"
         assert "already stopped" in result["message"]
 
-    @pytest.mark.asyncio
     async def test_pause_monitoring_success(self, mock_settings, mock_ingestion_service):
         """Test successful monitoring pause."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
@@ -442,7 +682,6 @@ class TestFileMonitor:
         mock_observer.stop.assert_called_once()
         mock_observer.join.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_pause_monitoring_not_running(self, mock_settings, mock_ingestion_service):
         """Test pausing monitoring when not running."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
@@ -452,27 +691,21 @@ class TestFileMonitor:
         assert result["status"] == "not_running"
         assert "Cannot pause" in result["message"]
 
-    @pytest.mark.asyncio
-    async def test_resume_monitoring_success(self, mock_settings, mock_ingestion_service, temp_export_directory):
+    async def test_resume_monitoring_success(self, mock_settings, mock_ingestion_service, temp_export_directory, mock_observer):
         """Test successful monitoring resume."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         monitor._status = MonitoringStatus.PAUSED
         
-        with patch('pd_graphiti_service.file_monitor.Observer') as mock_observer_class:
-            mock_observer = Mock()
-            mock_observer_class.return_value = mock_observer
-            
-            result = await monitor.resume_monitoring()
-            
-            assert result["status"] == "resumed"
-            assert "resumed" in result["message"]
-            assert monitor.status == MonitoringStatus.RUNNING
-            
-            # Verify new observer was created and started
-            mock_observer.schedule.assert_called_once()
-            mock_observer.start.assert_called_once()
+        result = await monitor.resume_monitoring()
+        
+        assert result["status"] == "resumed"
+        assert "resumed" in result["message"]
+        assert monitor.status == MonitoringStatus.RUNNING
+        
+        # Verify new observer was created and started
+        mock_observer.schedule.assert_called_once()
+        mock_observer.start.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_resume_monitoring_not_paused(self, mock_settings, mock_ingestion_service):
         """Test resuming monitoring when not paused."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
@@ -482,14 +715,14 @@ class TestFileMonitor:
         assert result["status"] == "not_paused"
         assert "Cannot resume" in result["message"]
 
-    @pytest.mark.asyncio
     async def test_trigger_directory_scan_success(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
         """Test successful directory scan."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         
         # Create some export directories
         export1 = create_sample_export(temp_export_directory, "export1", sample_export_data)
-        export2 = create_sample_export(temp_export_directory, "export2", sample_export_data)
+        export2_data = {**sample_export_data, "manifest": {**sample_export_data["manifest"], "checksum": "export2"}}
+        export2 = create_sample_export(temp_export_directory, "export2", export2_data)
         
         # Mock queue operations
         monitor._processing_queue = AsyncMock()
@@ -503,7 +736,37 @@ class TestFileMonitor:
         # Verify exports were queued
         assert monitor._processing_queue.put.call_count == 2
 
-    @pytest.mark.asyncio
+    async def test_trigger_directory_scan_dedupes_copies(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test directory scan queues identical exports only once."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        
+        clone_sample_export(temp_export_directory, "export1")
+        clone_sample_export(temp_export_directory, "export1_copy")
+        
+        monitor._processing_queue = AsyncMock()
+        
+        result = await monitor.trigger_directory_scan()
+        
+        assert result["discovered_exports"] == 1
+        assert monitor._processing_queue.put.call_count == 1
+
+    async def test_trigger_directory_scan_skips_files(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test directory scan only considers subdirectories of the export root."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        
+        export_path = clone_sample_export(temp_export_directory, "export1")
+        (temp_export_directory / "notes.json").write_text("{}")
+        
+        monitor._processing_queue = AsyncMock()
+        
+        result = await monitor.trigger_directory_scan()
+        
+        assert result["discovered_exports"] == 1
+        assert result["export_paths"] == [str(export_path)]
+        queued_path, queued_id = monitor._processing_queue.put.call_args[0][0]
+        assert queued_path == export_path
+        assert queued_id == monitor._get_export_id(export_path)
+
     async def test_trigger_directory_scan_nonexistent_directory(self, mock_settings, mock_ingestion_service):
         """Test directory scan with nonexistent directory."""
         nonexistent_dir = Path("/nonexistent/directory")
@@ -536,7 +799,7 @@ class TestFileMonitor:
         assert status["failed_results"] == 1
         assert "timestamp" in status
 
-    def test_clear_processing_history(self, mock_settings, mock_ingestion_service):
+    async def test_clear_processing_history(self, mock_settings, mock_ingestion_service):
         """Test clearing processing history."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service)
         
@@ -550,22 +813,34 @@ class TestFileMonitor:
         assert len(monitor._processed_exports) == 2
         assert len(monitor._processing_results) == 1
         
-        monitor.clear_processing_history()
+        await monitor.clear_processing_history()
         
         assert len(monitor._processed_exports) == 0
         assert len(monitor._processing_results) == 0
 
-    @pytest.mark.asyncio
-    async def test_async_context_manager(self, mock_settings, mock_ingestion_service, temp_export_directory):
+    def test_processing_results_bounded(self, mock_settings, mock_ingestion_service):
+        """Test that processing history is capped at max_history entries."""
+        settings = mock_settings.model_copy(update={"max_history": 5})
+        monitor = FileMonitor(settings, mock_ingestion_service)
+        
+        for i in range(8):
+            monitor._processing_results.append(ProcessingResult(Path(f"/test/export{i}"), IngestionStatus.SUCCESS, {}))
+        
+        assert len(monitor._processing_results) == 5
+        # The three oldest results were evicted, newest kept in order
+        assert [r.export_path for r in monitor._processing_results] == [
+            Path(f"/test/export{i}") for i in range(3, 8)
+        ]
+
+    async def test_async_context_manager(self, mock_settings, mock_ingestion_service, temp_export_directory, mock_observer):
         """Test FileMonitor as async context manager."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         
-        with patch('pd_graphiti_service.file_monitor.Observer'):
-            async with monitor as m:
-                assert m == monitor
-                assert monitor.is_running
-            
-            assert not monitor.is_running
+        async with monitor as m:
+            assert m == monitor
+            assert monitor.is_running
+        
+        assert not monitor.is_running
 
 
 class TestFileMonitorCreation:
@@ -590,32 +865,31 @@ class TestFileMonitorCreation:
 class TestFileMonitorIntegration:
     """Integration-style tests for FileMonitor."""
 
-    @pytest.mark.asyncio
-    async def test_export_processor_worker_success(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+    async def test_export_processor_worker_success(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
         """Test export processor worker with successful processing."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         monitor._status = MonitoringStatus.RUNNING
         
         # Create export and add to queue
-        export_path = create_sample_export(temp_export_directory, "test_export", sample_export_data)
+        export_path = clone_sample_export(temp_export_directory, "test_export")
         export_id = monitor._get_export_id(export_path)
         
         await monitor._processing_queue.put((export_path, export_id))
         
-        # Set up callbacks
+        # Set up callbacks; completion signals the test instead of a fixed sleep
+        processed = asyncio.Event()
         started_callback = Mock()
-        completed_callback = Mock()
+        completed_callback = Mock(side_effect=lambda result: processed.set())
         monitor.set_callbacks(on_export_started=started_callback, on_export_completed=completed_callback)
         
         # Process one item and then stop
         async def limited_worker():
             await monitor._export_processor_worker(0)
         
-        # Run worker briefly
         worker_task = asyncio.create_task(limited_worker())
         
-        # Wait a bit for processing
-        await asyncio.sleep(0.1)
+        # Wait for the export to be processed
+        await asyncio.wait_for(processed.wait(), timeout=2.0)
         
         # Stop monitoring to exit worker loop
         monitor._status = MonitoringStatus.STOPPED
@@ -637,8 +911,7 @@ class TestFileMonitorIntegration:
             force_reingest=False
         )
 
-    @pytest.mark.asyncio
-    async def test_export_processor_worker_failure(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+    async def test_export_processor_worker_failure(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
         """Test export processor worker with processing failure."""
         monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
         monitor._status = MonitoringStatus.RUNNING
@@ -651,24 +924,24 @@ class TestFileMonitorIntegration:
         }
         
         # Create export and add to queue
-        export_path = create_sample_export(temp_export_directory, "test_export", sample_export_data)
+        export_path = clone_sample_export(temp_export_directory, "test_export")
         export_id = monitor._get_export_id(export_path)
         
         await monitor._processing_queue.put((export_path, export_id))
         
-        # Set up callbacks
-        failed_callback = Mock()
+        # Set up callbacks; failure signals the test instead of a fixed sleep
+        processed = asyncio.Event()
+        failed_callback = Mock(side_effect=lambda path, error: processed.set())
         monitor.set_callbacks(on_export_failed=failed_callback)
         
         # Process one item and then stop
         async def limited_worker():
             await monitor._export_processor_worker(0)
         
-        # Run worker briefly
         worker_task = asyncio.create_task(limited_worker())
         
-        # Wait a bit for processing
-        await asyncio.sleep(0.1)
+        # Wait for the export to be processed
+        await asyncio.wait_for(processed.wait(), timeout=2.0)
         
         # Stop monitoring to exit worker loop
         monitor._status = MonitoringStatus.STOPPED
@@ -682,4 +955,180 @@ class TestFileMonitorIntegration:
         # Verify export was processed but marked as failed
         assert export_id in monitor._processed_exports
         assert len(monitor._processing_results) > 0
-        assert monitor._processing_results[0].status == IngestionStatus.FAILED
\ No newline at end of file
+        assert monitor._processing_results[0].status == IngestionStatus.FAILED
+
+    async def test_export_processor_worker_drains_batch(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that a worker drains queued exports in batches."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        monitor._status = MonitoringStatus.RUNNING
+        
+        for i in range(10):
+            await monitor._processing_queue.put((temp_export_directory / f"export_{i}", f"export_{i}"))
+        
+        worker_task = asyncio.create_task(monitor._export_processor_worker(0))
+        await asyncio.wait_for(monitor._processing_queue.join(), timeout=2.0)
+        
+        monitor._status = MonitoringStatus.STOPPED
+        await asyncio.wait_for(worker_task, timeout=2.0)
+        
+        assert mock_ingestion_service.process_export_directory.call_count == 10
+        assert len(monitor._processed_exports) == 10
+        assert not monitor._inflight_ids
+        assert not monitor._inflight_tasks
+
+    async def test_worker_cancelled_requeues_unstarted_batch(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that stopping a worker blocked on a slot returns its unstarted exports to the queue."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        monitor._status = MonitoringStatus.RUNNING
+        
+        # Occupy every ingestion slot so the worker blocks after draining its batch
+        for _ in range(mock_settings.max_concurrent_ingestions):
+            await monitor._ingestion_semaphore.acquire()
+        
+        items = [(temp_export_directory / f"export_{i}", f"export_{i}") for i in range(3)]
+        for export_path, export_id in items:
+            monitor._inflight_ids.add(export_id)
+            await monitor._processing_queue.put((export_path, export_id))
+        
+        worker_task = asyncio.create_task(monitor._export_processor_worker(0))
+        for _ in range(100):
+            if monitor._processing_queue.empty():
+                break
+            await asyncio.sleep(0)
+        assert monitor._processing_queue.empty()
+        
+        worker_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await worker_task
+        
+        assert monitor._processing_queue.qsize() == 3
+        assert monitor._inflight_ids == {export_id for _, export_id in items}
+        
+        # Only the re-queued items are outstanding, so join() settles once they are handled
+        for _ in items:
+            monitor._processing_queue.get_nowait()
+            monitor._processing_queue.task_done()
+        await asyncio.wait_for(monitor._processing_queue.join(), timeout=1.0)
+        mock_ingestion_service.process_export_directory.assert_not_called()
+
+    async def test_export_task_cancelled_before_start_is_requeued(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that cancelling a freshly spawned export task frees its slot and re-queues the export."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        item = (temp_export_directory / "export_0", "export_0")
+        monitor._inflight_ids.add(item[1])
+        await monitor._processing_queue.put(item)
+        
+        # Mirror the worker: dequeue, take a slot, spawn, then cancel before the task runs
+        dequeued = monitor._processing_queue.get_nowait()
+        await monitor._ingestion_semaphore.acquire()
+        task = monitor._start_export(*dequeued, worker_id=0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)  # let the done callback run
+        
+        mock_ingestion_service.process_export_directory.assert_not_called()
+        assert monitor._ingestion_semaphore._value == mock_settings.max_concurrent_ingestions
+        assert not monitor._inflight_tasks
+        assert monitor._inflight_ids == {item[1]}
+        assert monitor._processing_queue.get_nowait() == item
+        monitor._processing_queue.task_done()
+        await asyncio.wait_for(monitor._processing_queue.join(), timeout=1.0)
+
+    async def test_worker_parallel_ingests_are_overlapped(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that a worker keeps max_concurrent_ingestions exports in flight."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        monitor._status = MonitoringStatus.RUNNING
+        
+        release = asyncio.Event()
+        active = 0
+        peak = 0
+        
+        async def slow_ingest(export_path, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            active -= 1
+            return {"status": IngestionStatus.SUCCESS}
+        
+        mock_ingestion_service.process_export_directory.side_effect = slow_ingest
+        
+        for i in range(6):
+            await monitor._processing_queue.put((temp_export_directory / f"export_{i}", f"export_{i}"))
+        
+        worker_task = asyncio.create_task(monitor._export_processor_worker(0))
+        for _ in range(100):
+            if active == mock_settings.max_concurrent_ingestions:
+                break
+            await asyncio.sleep(0)
+        
+        # Slots are full: the worker waits instead of starting more
+        assert active == 4
+        assert len(monitor._inflight_tasks) == 4
+        
+        release.set()
+        await asyncio.wait_for(monitor._processing_queue.join(), timeout=2.0)
+        monitor._status = MonitoringStatus.STOPPED
+        await asyncio.wait_for(worker_task, timeout=2.0)
+        
+        assert peak == 4
+        assert mock_ingestion_service.process_export_directory.call_count == 6
+
+    async def test_restart_skips_processed(self, mock_settings, mock_ingestion_service, temp_export_directory, clone_sample_export):
+        """Test that exports ingested before a restart are not queued again."""
+        export_path = clone_sample_export(temp_export_directory, "test_export")
+        
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        await monitor._processing_queue.put((export_path, monitor._get_export_id(export_path)))
+        await monitor._process_one(*monitor._processing_queue.get_nowait(), worker_id=0)
+        
+        state_file = temp_export_directory / ".pd-graphiti" / "processed.json"
+        assert state_file.exists()
+        
+        restarted = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        result = await restarted.trigger_directory_scan()
+        
+        assert result["discovered_exports"] == 0
+        assert restarted._processing_queue.qsize() == 0
+
+    async def test_concurrent_record_processed_persists_all(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that exports recorded concurrently all end up in the state file."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        export_ids = [f"export_{i}" for i in range(8)]
+
+        await asyncio.gather(*(
+            monitor._record_processed(temp_export_directory / export_id, export_id)
+            for export_id in export_ids
+        ))
+
+        state_dir = temp_export_directory / ".pd-graphiti"
+        assert set(json.loads((state_dir / "processed.json").read_text())) == set(export_ids)
+        assert not list(state_dir.glob("*.tmp"))
+
+    async def test_clear_history_waits_for_pending_state_write(self, mock_settings, mock_ingestion_service, temp_export_directory):
+        """Test that clearing history is not undone by a state write already in flight."""
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        
+        record = asyncio.create_task(monitor._record_processed(temp_export_directory / "export_1", "export_1"))
+        await asyncio.sleep(0)  # the record task now holds the state lock
+        await monitor.clear_processing_history()
+        await record
+        
+        state_file = temp_export_directory / ".pd-graphiti" / "processed.json"
+        assert json.loads(state_file.read_text()) == {}
+
+    async def test_restart_requeues_changed_manifest(self, mock_settings, mock_ingestion_service, temp_export_directory, sample_export_data):
+        """Test that a persisted export is reprocessed if its manifest changed."""
+        export_path = create_sample_export(temp_export_directory, "test_export", sample_export_data)
+        
+        monitor = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        await monitor._processing_queue.put((export_path, monitor._get_export_id(export_path)))
+        await monitor._process_one(*monitor._processing_queue.get_nowait(), worker_id=0)
+        
+        (export_path / "manifest.json").write_text(json.dumps({**sample_export_data["manifest"], "checksum": "changed"}))
+        
+        restarted = FileMonitor(mock_settings, mock_ingestion_service, temp_export_directory)
+        result = await restarted.trigger_directory_scan()
+        
+        assert result["discovered_exports"] == 1
@@ -4,7 +4,13 @@ import asyncio
 import pytest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
+
+import openai
+from graphiti_core import Graphiti
+from neo4j import AsyncDriver, AsyncSession
+from openai.types.chat import ChatCompletion
+from tenacity import wait_none
 
 from pd_graphiti_service.config import Settings
 from pd_graphiti_service.graphiti_client import (
@@ -19,25 +25,32 @@ from pd_graphiti_service.models import (
     IngestionStatus
 )
 
-@pytest.fixture
+# Built without validation: these values are known-good and no test here
+# exercises Settings validation (see test_config.py for that).
+_TEST_SETTINGS = Settings.model_construct(
+    openai_api_key="test-key",
+    neo4j_password="test-password",
+    neo4j_uri="bolt://localhost:7687",
+    neo4j_user="neo4j",
+    graphiti_group_id="test_group"
+)
+
+_OVERSIZED_BODY = "x" * 100_001  # Over the 100KB episode_body limit
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings for testing."""
-    return Settings(
-        openai_api_key="test-key",
-        neo4j_password="test-password",
-        neo4j_uri="bolt://localhost:7687",
-        neo4j_user="neo4j",
-        graphiti_group_id="test_group"
-    )
+    """Create mock settings for testing (shared; tests only read it)."""
+    return _TEST_SETTINGS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_episode():
-    """Create a sample episode for testing."""
+    """Create a sample episode for testing (built once; tests only read it)."""
     metadata = EpisodeMetadata(
         gene_symbol="SNCA",
         episode_type="gene_profile",
-        export_timestamp=datetime.now(),
+        export_timestamp=datetime(2024, 1, 1),  # Fixed so the shared episode is deterministic
         file_path=Path("/test/snca.json"),
         file_size=1024
     )
@@ -51,372 +64,353 @@ def sample_episode():
     )
 
 
+@pytest.fixture(scope="session")
+def test_metadata():
+    """Create generic episode metadata for validation tests (shared; tests only read it)."""
+    return EpisodeMetadata(
+        gene_symbol="TEST",
+        episode_type="test",
+        export_timestamp=datetime(2024, 1, 1),
+        file_path=Path("/test/test.json"),
+        file_size=1024
+    )
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Replace the openai module used by graphiti_client."""
+    mock = MagicMock(spec=openai)
+    mock.OpenAI.return_value = MagicMock(spec=openai.OpenAI)
+    monkeypatch.setattr("pd_graphiti_service.graphiti_client.openai", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def mock_graphiti_class(monkeypatch, mock_openai):
+    """Replace openai and the Graphiti class for every test in this module.
+    
+    Tests that need a particular Graphiti instance or failure request this
+    fixture and configure ``return_value``/``side_effect`` on it.
+    """
+    mock = MagicMock(spec=Graphiti)
+    monkeypatch.setattr("pd_graphiti_service.graphiti_client.Graphiti", mock)
+    return mock
+
+
+@pytest.fixture
+def client(mock_settings, mock_graphiti_class):
+    """Create a GraphitiClient against the patched openai/Graphiti.
+    
+    Request ``mock_graphiti_class`` alongside it to configure the Graphiti
+    instance; it is only constructed on the client's first ``_get_graphiti()``.
+    """
+    return GraphitiClient(mock_settings)
+
+
+class _StatsResult:
+    """Minimal Neo4j result: ``single()`` plus async iteration over records."""
+    
+    def __init__(self, records):
+        self._records = records
+    
+    async def single(self):
+        return self._records[0] if self._records else None
+    
+    async def __aiter__(self):
+        for record in self._records:
+            yield record
+
+
+class _StatsSession:
+    """Fake Neo4j session answering the get_graph_stats queries.
+    
+    Queries are matched on their ``as <alias>`` return column; anything else
+    (e.g. the ``RETURN 1`` connectivity probe) gets an empty result. The
+    session is its own async context manager, like ``AsyncSession``.
+    """
+    
+    def __init__(self, node_count=0, rel_count=0, group_nodes=0, node_types=()):
+        self._answers = {
+            "node_count": [{"node_count": node_count}],
+            "rel_count": [{"rel_count": rel_count}],
+            "group_nodes": [{"group_nodes": group_nodes}],
+            "labels": list(node_types),
+        }
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return None
+    
+    async def run(self, query, **params):
+        for alias, records in self._answers.items():
+            if f"as {alias}" in query:
+                return _StatsResult(records)
+        return _StatsResult([])
+
+
+def _build_graphiti_mock(session_run_side_effect=None, session=None):
+    """Build a Graphiti mock whose ``driver.session()`` yields a mock Neo4j session.
+    
+    Args:
+        session_run_side_effect: Optional side effect for ``session.run``
+            (e.g. a list of query results).
+        session: Optional ready-made session (e.g. ``_StatsSession``) to
+            return from ``driver.session()`` instead of a mock.
+    
+    Returns:
+        Tuple of (mock_graphiti, session).
+    """
+    mock_driver = AsyncMock(spec=AsyncDriver)
+    if session is not None:
+        mock_driver.session = Mock(return_value=session)
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.driver = mock_driver
+        return mock_graphiti, session
+    
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.run = AsyncMock(side_effect=session_run_side_effect)
+    
+    mock_session_context = AsyncMock(spec=AsyncSession)
+    mock_session_context.__aenter__.return_value = mock_session
+    mock_session_context.__aexit__.return_value = None
+    
+    mock_driver.session = Mock(return_value=mock_session_context)
+    
+    mock_graphiti = AsyncMock(spec=Graphiti)
+    mock_graphiti.driver = mock_driver
+    return mock_graphiti, mock_session
+
+
+@pytest.fixture
+def graphiti_mock_factory():
+    """Factory for Graphiti/Neo4j-session mock pairs (see ``_build_graphiti_mock``)."""
+    return _build_graphiti_mock
+
+
 class TestGraphitiClient:
     """Test GraphitiClient class."""
 
-    def test_client_initialization(self, mock_settings):
+    def test_client_initialization(self, mock_settings, mock_openai):
         """Test GraphitiClient initialization."""
-        with patch('pd_graphiti_service.graphiti_client.openai') as mock_openai:
-            client = GraphitiClient(mock_settings)
-            
-            assert client.settings == mock_settings
-            assert client._graphiti is None
-            assert not client._database_initialized
-            
-            # Verify OpenAI API key is set
-            mock_openai.api_key = mock_settings.openai_api_key
-
-    @pytest.mark.asyncio
-    async def test_get_graphiti_creates_instance(self, mock_settings):
+        client = GraphitiClient(mock_settings)
+        
+        assert client.settings == mock_settings
+        assert client._graphiti is None
+        assert not client._database_initialized
+        
+        # Verify OpenAI API key is set
+        mock_openai.api_key = mock_settings.openai_api_key
+
+    async def test_get_graphiti_creates_instance(self, client, mock_settings, mock_graphiti_class):
         """Test that _get_graphiti creates Graphiti instance."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            mock_graphiti_instance = AsyncMock()
-            mock_graphiti_class.return_value = mock_graphiti_instance
-            
-            client = GraphitiClient(mock_settings)
-            
-            # First call should create instance
-            result = await client._get_graphiti()
-            
-            assert result == mock_graphiti_instance
-            assert client._graphiti == mock_graphiti_instance
-            
-            # Second call should return same instance
-            result2 = await client._get_graphiti()
-            assert result2 == mock_graphiti_instance
-            
-            # Verify Graphiti was initialized with correct parameters
-            mock_graphiti_class.assert_called_once_with(
-                uri=mock_settings.neo4j_uri,
-                user=mock_settings.neo4j_user,
-                password=mock_settings.neo4j_password,
-                driver_config={"database": "neo4j"}
-            )
-
-    @pytest.mark.asyncio
-    async def test_initialize_database_success(self, mock_settings):
+        mock_graphiti_instance = AsyncMock(spec=Graphiti)
+        mock_graphiti_class.return_value = mock_graphiti_instance
+        
+        # First call should create instance
+        result = await client._get_graphiti()
+        
+        assert result == mock_graphiti_instance
+        assert client._graphiti == mock_graphiti_instance
+        
+        # Second call should return same instance
+        result2 = await client._get_graphiti()
+        assert result2 == mock_graphiti_instance
+        
+        # Verify Graphiti was initialized with correct parameters
+        mock_graphiti_class.assert_called_once_with(
+            uri=mock_settings.neo4j_uri,
+            user=mock_settings.neo4j_user,
+            password=mock_settings.neo4j_password,
+            driver_config={"database": "neo4j"}
+        )
+
+    async def test_initialize_database_success(self, client, mock_graphiti_class):
         """Test successful database initialization."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.build_indices_and_constraints = AsyncMock()
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            result = await client.initialize_database()
-            
-            assert result["status"] == "success"
-            assert "Graphiti database initialized successfully" in result["message"]
-            assert client._database_initialized is True
-            
-            mock_graphiti.build_indices_and_constraints.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_initialize_database_failure(self, mock_settings):
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.build_indices_and_constraints = AsyncMock()
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        result = await client.initialize_database()
+        
+        assert result["status"] == "success"
+        assert "Graphiti database initialized successfully" in result["message"]
+        assert client._database_initialized is True
+        
+        mock_graphiti.build_indices_and_constraints.assert_called_once()
+
+    async def test_initialize_database_failure(self, client, mock_graphiti_class, monkeypatch):
         """Test database initialization failure."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.build_indices_and_constraints.side_effect = Exception("Database error")
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            # The retry decorator will retry 3 times before failing with RetryError
-            with pytest.raises(Exception) as exc_info:
-                await client.initialize_database()
-            
-            # Could be either RetryError or GraphitiConnectionError depending on retry behavior
-            assert "Database error" in str(exc_info.value) or "RetryError" in str(exc_info.value)
-            assert client._database_initialized is False
-
-    @pytest.mark.asyncio
-    async def test_test_connection_success(self, mock_settings):
+        # Keep the retries but skip tenacity's 4-10s exponential backoff between them
+        monkeypatch.setattr(GraphitiClient.initialize_database.retry, "wait", wait_none())
+        
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.build_indices_and_constraints.side_effect = Exception("Database error")
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        # The retry decorator will retry 3 times before failing with RetryError
+        with pytest.raises(Exception) as exc_info:
+            await client.initialize_database()
+        
+        # Could be either RetryError or GraphitiConnectionError depending on retry behavior
+        assert "Database error" in str(exc_info.value) or "RetryError" in str(exc_info.value)
+        assert client._database_initialized is False
+
+    async def test_test_connection_success(self, client, mock_openai, mock_graphiti_class, graphiti_mock_factory):
         """Test successful connection test."""
-        with patch('pd_graphiti_service.graphiti_client.openai') as mock_openai, \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            # Mock Neo4j connection - properly mock async context manager
-            mock_session = AsyncMock()
-            mock_session.run = AsyncMock()
-            
-            # Create proper async context manager mock
-            mock_session_context = AsyncMock()
-            mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_context.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_driver = AsyncMock()
-            mock_driver.session = Mock(return_value=mock_session_context)
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.driver = mock_driver
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            # Mock OpenAI API
-            mock_openai_client = Mock()
-            mock_response = Mock()
-            mock_openai_client.chat.completions.create.return_value = mock_response
-            mock_openai.OpenAI.return_value = mock_openai_client
-            
-            client = GraphitiClient(mock_settings)
-            client._database_initialized = True  # Set for full readiness
-            
-            result = await client.test_connection()
-            
-            assert result["neo4j_connected"] is True
-            assert result["openai_accessible"] is True
-            assert result["graphiti_ready"] is True
-            assert len(result["errors"]) == 0
-
-    @pytest.mark.asyncio
-    async def test_test_connection_neo4j_failure(self, mock_settings):
+        # Mock Neo4j connection
+        mock_graphiti, _ = graphiti_mock_factory()
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        # Mock OpenAI API
+        mock_openai.OpenAI.return_value.chat.completions.create.return_value = Mock(spec=ChatCompletion)
+        
+        client._database_initialized = True  # Set for full readiness
+        
+        result = await client.test_connection()
+        
+        assert result["neo4j_connected"] is True
+        assert result["openai_accessible"] is True
+        assert result["graphiti_ready"] is True
+        assert len(result["errors"]) == 0
+
+    async def test_test_connection_neo4j_failure(self, client, mock_openai, mock_graphiti_class):
         """Test connection test with Neo4j failure."""
-        with patch('pd_graphiti_service.graphiti_client.openai') as mock_openai, \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            # Mock Neo4j connection failure
-            mock_graphiti_class.side_effect = Exception("Neo4j connection failed")
-            
-            # Mock successful OpenAI
-            mock_openai_client = Mock()
-            mock_response = Mock()
-            mock_openai_client.chat.completions.create.return_value = mock_response
-            mock_openai.OpenAI.return_value = mock_openai_client
-            
-            client = GraphitiClient(mock_settings)
-            
-            result = await client.test_connection()
-            
-            assert result["neo4j_connected"] is False
-            assert result["openai_accessible"] is True
-            assert result["graphiti_ready"] is False
-            assert len(result["errors"]) > 0
-            assert "Neo4j connection failed" in result["errors"][0]
-
-    def test_validate_episode_success(self, mock_settings, sample_episode):
+        # Mock Neo4j connection failure
+        mock_graphiti_class.side_effect = Exception("Neo4j connection failed")
+        
+        # Mock successful OpenAI
+        mock_openai.OpenAI.return_value.chat.completions.create.return_value = Mock(spec=ChatCompletion)
+        
+        result = await client.test_connection()
+        
+        assert result["neo4j_connected"] is False
+        assert result["openai_accessible"] is True
+        assert result["graphiti_ready"] is False
+        assert len(result["errors"]) > 0
+        assert "Neo4j connection failed" in result["errors"][0]
+
+    def test_validate_episode_success(self, client, sample_episode):
         """Test successful episode validation."""
-        with patch('pd_graphiti_service.graphiti_client.openai'):
-            client = GraphitiClient(mock_settings)
-            
-            # Should not raise any exception
-            client._validate_episode(sample_episode)
-
-    def test_validate_episode_missing_required_fields(self, mock_settings):
-        """Test episode validation with missing required fields."""
-        with patch('pd_graphiti_service.graphiti_client.openai'):
-            client = GraphitiClient(mock_settings)
-            
-            metadata = EpisodeMetadata(
-                gene_symbol="TEST",
-                episode_type="test",
-                export_timestamp=datetime.now(),
-                file_path=Path("/test/test.json"),
-                file_size=1024
-            )
-            
-            # Test missing episode_name
-            episode = GraphitiEpisode(
-                episode_name="",  # Empty name
-                episode_body="test body",
-                source="test",
-                source_description="test",
-                metadata=metadata
-            )
-            
-            with pytest.raises(GraphitiValidationError) as exc_info:
-                client._validate_episode(episode)
-            
-            assert "episode_name is required" in str(exc_info.value)
-
-    def test_validate_episode_too_large(self, mock_settings):
-        """Test episode validation with too large body."""
-        with patch('pd_graphiti_service.graphiti_client.openai'):
-            client = GraphitiClient(mock_settings)
-            
-            metadata = EpisodeMetadata(
-                gene_symbol="TEST",
-                episode_type="test",
-                export_timestamp=datetime.now(),
-                file_path=Path("/test/test.json"),
-                file_size=1024
-            )
-            
-            # Create episode with body too large
-            large_body = "x" * 100001  # Over 100KB limit
-            episode = GraphitiEpisode(
-                episode_name="Test_Episode",
-                episode_body=large_body,
-                source="test",
-                source_description="test",
-                metadata=metadata
-            )
-            
-            with pytest.raises(GraphitiValidationError) as exc_info:
-                client._validate_episode(episode)
-            
-            assert "episode_body too large" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_add_episode_success(self, mock_settings, sample_episode):
+        # Should not raise any exception
+        client._validate_episode(sample_episode)
+
+    @pytest.mark.parametrize("episode_name,episode_body,expected_msg", [
+        ("", "test body", "episode_name is required"),
+        ("Test_Episode", _OVERSIZED_BODY, "episode_body too large"),
+    ], ids=["missing_name", "body_too_large"])
+    def test_validate_episode_invalid(self, client, test_metadata, episode_name, episode_body, expected_msg):
+        """Test episode validation rejects empty names and oversized bodies."""
+        episode = GraphitiEpisode(
+            episode_name=episode_name,
+            episode_body=episode_body,
+            source="test",
+            source_description="test",
+            metadata=test_metadata
+        )
+        
+        with pytest.raises(GraphitiValidationError) as exc_info:
+            client._validate_episode(episode)
+        
+        assert expected_msg in str(exc_info.value)
+
+    async def test_add_episode_success(self, client, mock_settings, sample_episode, mock_graphiti_class):
         """Test successful episode addition."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            # Mock successful Graphiti response
-            mock_result = Mock()
-            mock_result.node_id = "node_123"
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.add_memory.return_value = mock_result
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            result = await client.add_episode(sample_episode)
-            
-            assert result["status"] == IngestionStatus.SUCCESS
-            assert result["episode_name"] == sample_episode.episode_name
-            assert result["graphiti_node_id"] == "node_123"
-            assert "processing_time_seconds" in result
-            
-            # Verify Graphiti was called with correct parameters
-            mock_graphiti.add_memory.assert_called_once_with(
-                name=sample_episode.episode_name,
-                episode_body=sample_episode.episode_body,
-                source=sample_episode.source,
-                source_description=sample_episode.source_description,
-                group_id=sample_episode.group_id
-            )
-
-    @pytest.mark.asyncio
-    async def test_add_episode_validation_error(self, mock_settings):
+        # Mock successful Graphiti response
+        mock_result = Mock()
+        mock_result.node_id = "node_123"
+        
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.add_episode.return_value = mock_result
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        result = await client.add_episode(sample_episode)
+        
+        assert result["status"] == IngestionStatus.SUCCESS
+        assert result["episode_name"] == sample_episode.episode_name
+        assert result["graphiti_node_id"] == "node_123"
+        assert "processing_time_seconds" in result
+        
+        # Verify Graphiti was called with correct parameters
+        mock_graphiti.add_episode.assert_called_once()
+        call_kwargs = mock_graphiti.add_episode.call_args.kwargs
+        assert call_kwargs["name"] == sample_episode.episode_name
+        assert call_kwargs["source_description"] == sample_episode.source_description
+        assert call_kwargs["group_id"] == (sample_episode.group_id or mock_settings.graphiti_group_id)
+
+    async def test_add_episode_validation_error(self, client, test_metadata):
         """Test episode addition with validation error."""
-        with patch('pd_graphiti_service.graphiti_client.openai'):
-            client = GraphitiClient(mock_settings)
-            
-            # Create invalid episode
-            metadata = EpisodeMetadata(
-                gene_symbol="TEST",
-                episode_type="test",
-                export_timestamp=datetime.now(),
-                file_path=Path("/test/test.json"),
-                file_size=1024
-            )
-            
-            invalid_episode = GraphitiEpisode(
-                episode_name="",  # Invalid empty name
-                episode_body="test body",
-                source="test",
-                source_description="test",
-                metadata=metadata
-            )
-            
-            with pytest.raises(GraphitiValidationError):
-                await client.add_episode(invalid_episode)
-
-    @pytest.mark.asyncio
-    async def test_add_episodes_batch_success(self, mock_settings, sample_episode):
+        # Create invalid episode
+        invalid_episode = GraphitiEpisode(
+            episode_name="",  # Invalid empty name
+            episode_body="test body",
+            source="test",
+            source_description="test",
+            metadata=test_metadata
+        )
+        
+        with pytest.raises(GraphitiValidationError):
+            await client.add_episode(invalid_episode)
+
+    async def test_add_episodes_batch_success(self, client, sample_episode, mock_graphiti_class):
         """Test successful batch episode addition."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            mock_result = Mock()
-            mock_result.node_id = "node_123"
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.add_memory.return_value = mock_result
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            # Create multiple episodes with different types for ordering test
-            episodes = [sample_episode]  # gene_profile type
-            
-            result = await client.add_episodes_batch(episodes)
-            
-            assert result["status"] == IngestionStatus.SUCCESS
-            assert result["total_episodes"] == 1
-            assert result["successful"] == 1
-            assert result["failed"] == 0
-            assert len(result["episode_results"]) == 1
-
-    @pytest.mark.asyncio
-    async def test_get_graph_stats_success(self, mock_settings):
+        mock_result = Mock()
+        mock_result.node_id = "node_123"
+        
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.add_episode.return_value = mock_result
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        # Create multiple episodes with different types for ordering test
+        episodes = [sample_episode]  # gene_profile type
+        
+        result = await client.add_episodes_batch(episodes)
+        
+        assert result["status"] == IngestionStatus.SUCCESS
+        assert result["total_episodes"] == 1
+        assert result["successful"] == 1
+        assert result["failed"] == 0
+        assert len(result["episode_results"]) == 1
+
+    async def test_get_graph_stats_success(self, client, mock_settings, mock_graphiti_class, graphiti_mock_factory):
         """Test successful graph statistics retrieval."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            # Mock Neo4j session and query results
-            mock_record1 = {"node_count": 100}
-            mock_record2 = {"rel_count": 50}
-            mock_record3 = {"group_nodes": 25}
-            
-            mock_result1 = AsyncMock()
-            mock_result1.single.return_value = mock_record1
-            
-            mock_result2 = AsyncMock()
-            mock_result2.single.return_value = mock_record2
-            
-            mock_result3 = AsyncMock()
-            mock_result3.single.return_value = mock_record3
-            
-            mock_result4 = AsyncMock()
-            mock_result4.__aiter__.return_value = [
+        # Mock Neo4j session and query results
+        stats_session = _StatsSession(
+            node_count=100,
+            rel_count=50,
+            group_nodes=25,
+            node_types=[
                 {"labels": ["Entity"], "count": 15},
                 {"labels": ["Episode"], "count": 10}
             ]
-            
-            mock_session = AsyncMock()
-            mock_session.run.side_effect = [mock_result1, mock_result2, mock_result3, mock_result4]
-            
-            # Create proper async context manager mock
-            mock_session_context = AsyncMock()
-            mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_context.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_driver = AsyncMock()
-            mock_driver.session = Mock(return_value=mock_session_context)
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.driver = mock_driver
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            result = await client.get_graph_stats()
-            
-            assert result["total_nodes"] == 100
-            assert result["total_relationships"] == 50
-            assert result["group_nodes"] == 25
-            assert result["group_id"] == mock_settings.graphiti_group_id
-            assert "node_types" in result
-            assert "timestamp" in result
-
-    @pytest.mark.asyncio
-    async def test_close_client(self, mock_settings):
+        )
+        mock_graphiti, _ = graphiti_mock_factory(session=stats_session)
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        result = await client.get_graph_stats()
+        
+        assert result["total_nodes"] == 100
+        assert result["total_relationships"] == 50
+        assert result["group_nodes"] == 25
+        assert result["group_id"] == mock_settings.graphiti_group_id
+        assert result["node_types"] == {"Entity": 15, "Episode": 10}
+        assert "timestamp" in result
+
+    async def test_close_client(self, client, mock_graphiti_class):
         """Test client cleanup."""
-        with patch('pd_graphiti_service.graphiti_client.openai'), \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.close = AsyncMock()
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            client = GraphitiClient(mock_settings)
-            
-            # Initialize graphiti instance
-            await client._get_graphiti()
-            
-            # Close client
-            await client.close()
-            
-            assert client._graphiti is None
-            mock_graphiti.close.assert_called_once()
+        mock_graphiti = AsyncMock(spec=Graphiti)
+        mock_graphiti.close = AsyncMock()
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        # Initialize graphiti instance
+        await client._get_graphiti()
+        
+        # Close client
+        await client.close()
+        
+        assert client._graphiti is None
+        mock_graphiti.close.assert_called_once()
 
 
 class TestGraphitiClientCreation:
@@ -424,77 +418,52 @@ class TestGraphitiClientCreation:
 
     def test_create_graphiti_client(self, mock_settings):
         """Test create_graphiti_client convenience function."""
-        with patch('pd_graphiti_service.graphiti_client.openai'):
-            client = create_graphiti_client(mock_settings)
-            
-            assert isinstance(client, GraphitiClient)
-            assert client.settings == mock_settings
+        client = create_graphiti_client(mock_settings)
+        
+        assert isinstance(client, GraphitiClient)
+        assert client.settings == mock_settings
 
 
 class TestGraphitiClientIntegration:
     """Integration-style tests (still mocked but more comprehensive)."""
 
-    @pytest.mark.asyncio
-    async def test_full_workflow_success(self, mock_settings, sample_episode):
+    async def test_full_workflow_success(self, client, sample_episode, mock_openai, mock_graphiti_class, graphiti_mock_factory):
         """Test complete workflow: init -> test -> add episode -> stats."""
-        with patch('pd_graphiti_service.graphiti_client.openai') as mock_openai, \
-             patch('pd_graphiti_service.graphiti_client.Graphiti') as mock_graphiti_class:
-            
-            # Setup comprehensive mocks
-            mock_result = Mock()
-            mock_result.node_id = "node_123"
-            
-            mock_session = AsyncMock()
-            mock_session.run = AsyncMock()
-            
-            # Create proper async context manager mock
-            mock_session_context = AsyncMock()
-            mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_context.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_driver = AsyncMock()
-            mock_driver.session = Mock(return_value=mock_session_context)
-            
-            mock_graphiti = AsyncMock()
-            mock_graphiti.driver = mock_driver
-            mock_graphiti.build_indices_and_constraints = AsyncMock()
-            mock_graphiti.add_memory.return_value = mock_result
-            mock_graphiti.close = AsyncMock()
-            mock_graphiti_class.return_value = mock_graphiti
-            
-            # Mock OpenAI
-            mock_openai_client = Mock()
-            mock_response = Mock()
-            mock_openai_client.chat.completions.create.return_value = mock_response
-            mock_openai.OpenAI.return_value = mock_openai_client
-            
-            client = GraphitiClient(mock_settings)
-            
-            # 1. Initialize database
-            init_result = await client.initialize_database()
-            assert init_result["status"] == "success"
-            assert client._database_initialized is True
-            
-            # 2. Test connections
-            conn_result = await client.test_connection()
-            assert conn_result["graphiti_ready"] is True
-            
-            # 3. Add episode
-            add_result = await client.add_episode(sample_episode)
-            assert add_result["status"] == IngestionStatus.SUCCESS
-            
-            # 4. Get stats (mock the session.run calls for stats)
-            mock_session.run.side_effect = [
-                # Mock results for each stats query
-                AsyncMock(**{"single.return_value": {"node_count": 1}}),
-                AsyncMock(**{"single.return_value": {"rel_count": 0}}),
-                AsyncMock(**{"single.return_value": {"group_nodes": 1}}),
-                AsyncMock(**{"__aiter__.return_value": [{"labels": ["Entity"], "count": 1}]})
-            ]
-            
-            stats_result = await client.get_graph_stats()
-            assert "total_nodes" in stats_result
-            
-            # 5. Close client
-            await client.close()
-            assert client._graphiti is None
\ No newline at end of file
+        # Setup comprehensive mocks
+        mock_result = Mock()
+        mock_result.node_id = "node_123"
+        
+        stats_session = _StatsSession(
+            node_count=1,
+            group_nodes=1,
+            node_types=[{"labels": ["Entity"], "count": 1}]
+        )
+        mock_graphiti, _ = graphiti_mock_factory(session=stats_session)
+        mock_graphiti.build_indices_and_constraints = AsyncMock()
+        mock_graphiti.add_episode.return_value = mock_result
+        mock_graphiti.close = AsyncMock()
+        mock_graphiti_class.return_value = mock_graphiti
+        
+        # Mock OpenAI
+        mock_openai.OpenAI.return_value.chat.completions.create.return_value = Mock(spec=ChatCompletion)
+        
+        # 1. Initialize database
+        init_result = await client.initialize_database()
+        assert init_result["status"] == "success"
+        assert client._database_initialized is True
+        
+        # 2. Test connections
+        conn_result = await client.test_connection()
+        assert conn_result["graphiti_ready"] is True
+        
+        # 3. Add episode
+        add_result = await client.add_episode(sample_episode)
+        assert add_result["status"] == IngestionStatus.SUCCESS
+        
+        # 4. Get stats
+        stats_result = await client.get_graph_stats()
+        assert "total_nodes" in stats_result
+        
+        # 5. Close client
+        await client.close()
+        assert client._graphiti is None
@@ -1,15 +1,13 @@
 """Tests for IngestionService."""
 
-import asyncio
+import hashlib
 import json
-import tempfile
 import pytest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from unittest.mock import AsyncMock
 
 from pd_graphiti_service.config import Settings
-from pd_graphiti_service.graphiti_client import GraphitiClient
 from pd_graphiti_service.ingestion_service import (
     IngestionService,
     IngestionError,
@@ -25,9 +23,9 @@ from pd_graphiti_service.models import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings for testing."""
+    """Create mock settings for testing (built once; tests only read it)."""
     return Settings(
         openai_api_key="test-key",
         neo4j_password="test-password",
@@ -37,54 +35,111 @@ def mock_settings():
     )
 
 
-@pytest.fixture
-def mock_graphiti_client():
-    """Create mock GraphitiClient."""
-    client = AsyncMock(spec=GraphitiClient)
+class _FakeGraphitiClient:
+    """Stand-in for GraphitiClient exposing only what IngestionService calls.
     
-    # Mock successful episode ingestion
-    client.add_episode.return_value = {
-        "status": IngestionStatus.SUCCESS,
-        "episode_name": "test_episode",
-        "processing_time_seconds": 0.1,
-        "graphiti_node_id": "node_123"
-    }
+    Avoids the cost of ``AsyncMock(spec=GraphitiClient)`` introspection while
+    keeping call assertions on the two ingestion methods.
+    """
     
-    # Mock successful batch ingestion
-    client.add_episodes_batch.return_value = {
-        "status": IngestionStatus.SUCCESS,
-        "total_episodes": 1,
-        "successful": 1,
-        "failed": 0,
-        "episode_results": [{
+    def __init__(self):
+        # Mock successful episode ingestion
+        self.add_episode = AsyncMock(return_value={
             "status": IngestionStatus.SUCCESS,
-            "episode_name": "test_episode"
-        }]
-    }
-    
-    return client
+            "episode_name": "test_episode",
+            "processing_time_seconds": 0.1,
+            "graphiti_node_id": "node_123"
+        })
+        
+        # Mock successful batch ingestion
+        self.add_episodes_batch = AsyncMock(return_value={
+            "status": IngestionStatus.SUCCESS,
+            "total_episodes": 1,
+            "successful": 1,
+            "failed": 0,
+            "episode_results": [{
+                "status": IngestionStatus.SUCCESS,
+                "episode_name": "test_episode"
+            }]
+        })
+
+
+@pytest.fixture
+def mock_graphiti_client():
+    """Create mock GraphitiClient."""
+    return _FakeGraphitiClient()
 
 
 @pytest.fixture
+def service(mock_settings, mock_graphiti_client):
+    """Create an IngestionService wired to the mock GraphitiClient."""
+    return IngestionService(mock_settings, mock_graphiti_client)
+
+
+@pytest.fixture(autouse=True)
+def patched_checksum(request, monkeypatch):
+    """Stub out file hashing unless the test is marked ``real_checksum``."""
+    if request.node.get_closest_marker("real_checksum"):
+        return
+    monkeypatch.setattr(IngestionService, "_calculate_file_checksum", lambda self, file_path: "0" * 32)
+
+
+@pytest.fixture(scope="session")
 def sample_manifest_data():
-    """Create sample manifest data."""
+    """Create sample manifest data in the Dagster export format (shared; tests only read it)."""
     return {
-        "export_id": "test_export_20250701_123456",
-        "export_timestamp": "2025-07-01T12:34:56",
-        "dagster_run_id": "dagster_run_123",
-        "total_episodes": 2,
-        "episode_types": {
-            "gene_profile": 1,
-            "gwas_evidence": 1
+        "export_info": {
+            "timestamp": "20250701_123456",
+            "directory": "exports/test_export_20250701_123456",
+            "dagster_asset": "test_export",
+            "pipeline_version": "1.0.0"
+        },
+        "episode_summary": {
+            "total_episodes": 2,
+            "episodes_by_type": {"gene_profile": 1, "gwas_evidence": 1},
+            "genes_included": ["SNCA", "LRRK2"],
+            "total_genes": 2
+        },
+        "ingestion_instructions": {
+            "recommended_order": ["gene_profile", "gwas_evidence"],
+            "file_format": "json",
+            "encoding": "utf-8",
+            "episode_structure": {
+                "episode_metadata": "Episode metadata",
+                "graphiti_episode": "Graphiti episode data"
+            }
         },
-        "genes": ["SNCA", "LRRK2"],
-        "checksum": "abc123def456"
+        "validation": {
+            "total_files": 2,
+            "total_errors": 0,
+            "success_rate": 100.0,
+            "checksums_available": False
+        },
+        "next_steps": []
     }
 
 
+@pytest.fixture(scope="session")
+def sample_manifest_bytes(sample_manifest_data):
+    """Serialize the sample manifest once for every test that writes it to disk."""
+    return json.dumps(sample_manifest_data).encode()
+
+
+@pytest.fixture(scope="session")
+def prebuilt_manifest(sample_manifest_data):
+    """Validate the sample manifest once for tests that don't exercise _load_manifest."""
+    return ExportManifest.model_validate(sample_manifest_data)
+
+
 @pytest.fixture
+def fast_manifest_loader(service, prebuilt_manifest, monkeypatch):
+    """Make the service return the prebuilt manifest instead of parsing manifest.json."""
+    monkeypatch.setattr(service, "_load_manifest", lambda export_dir: prebuilt_manifest)
+
+
+@pytest.fixture(scope="session")
 def sample_episode_data():
-    """Create sample episode data."""
+    """Create sample episode data (shared; tests only read it)."""
     return {
         "episode_name": "Gene_Profile_SNCA",
         "episode_body": "SNCA encodes α-synuclein, a protein central to Parkinson's disease pathology...",
@@ -94,42 +149,56 @@ def sample_episode_data():
     }
 
 
-@pytest.fixture
-def temp_export_dir(sample_manifest_data, sample_episode_data):
-    """Create temporary export directory with sample files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        export_dir = Path(temp_dir) / "test_export"
-        export_dir.mkdir()
-        
-        # Create manifest.json
-        manifest_path = export_dir / "manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(sample_manifest_data, f)
-        
-        # Create episodes directory structure
-        episodes_dir = export_dir / "episodes"
-        episodes_dir.mkdir()
-        
-        gene_profile_dir = episodes_dir / "gene_profile"
-        gene_profile_dir.mkdir()
-        
-        gwas_dir = episodes_dir / "gwas_evidence"
-        gwas_dir.mkdir()
-        
-        # Create episode files
-        snca_episode_path = gene_profile_dir / "SNCA_gene_profile.json"
-        with open(snca_episode_path, 'w') as f:
-            json.dump(sample_episode_data, f)
-        
-        gwas_episode_data = sample_episode_data.copy()
-        gwas_episode_data["episode_name"] = "GWAS_Evidence_SNCA"
-        gwas_episode_data["episode_body"] = "GWAS evidence for SNCA..."
-        
-        gwas_episode_path = gwas_dir / "SNCA_gwas_evidence.json"
-        with open(gwas_episode_path, 'w') as f:
-            json.dump(gwas_episode_data, f)
-        
-        yield export_dir
+@pytest.fixture(scope="session")
+def sample_episode():
+    """Create a sample episode (shared; processed state lives on the service, not the episode)."""
+    metadata = EpisodeMetadata(
+        gene_symbol="SNCA",
+        episode_type="gene_profile",
+        export_timestamp=datetime(2024, 1, 1),
+        file_path=Path("/test/snca.json"),
+        file_size=1024
+    )
+    
+    return GraphitiEpisode(
+        episode_name="Gene_Profile_SNCA",
+        episode_body="SNCA episode content",
+        source="test",
+        source_description="test",
+        metadata=metadata
+    )
+
+
+@pytest.fixture(scope="session")
+def temp_export_dir(tmp_path_factory, sample_manifest_bytes, sample_episode_data):
+    """Create an export directory with sample files once per session.
+    
+    IngestionService only reads export directories, so tests can share it.
+    """
+    export_dir = tmp_path_factory.mktemp("test_export")
+    
+    # Create manifest.json
+    (export_dir / "manifest.json").write_bytes(sample_manifest_bytes)
+    
+    # Create episodes directory structure (parents=True creates episodes/ too)
+    gene_profile_dir = export_dir / "episodes" / "gene_profile"
+    gene_profile_dir.mkdir(parents=True)
+    
+    gwas_dir = export_dir / "episodes" / "gwas_evidence"
+    gwas_dir.mkdir(parents=True)
+    
+    # Create episode files
+    (gene_profile_dir / "SNCA_gene_profile.json").write_bytes(json.dumps(sample_episode_data).encode())
+    
+    gwas_episode_data = {
+        **sample_episode_data,
+        "episode_name": "GWAS_Evidence_SNCA",
+        "episode_body": "GWAS evidence for SNCA..."
+    }
+    
+    (gwas_dir / "SNCA_gwas_evidence.json").write_bytes(json.dumps(gwas_episode_data).encode())
+    
+    return export_dir
 
 
 class TestIngestionService:
@@ -143,33 +212,25 @@ class TestIngestionService:
         assert service.graphiti_client == mock_graphiti_client
         assert len(service._processed_episodes) == 0
 
-    def test_calculate_file_checksum(self, mock_settings, mock_graphiti_client):
+    @pytest.mark.real_checksum
+    def test_calculate_file_checksum(self, service, tmp_path):
         """Test file checksum calculation."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+        temp_path = tmp_path / "file.txt"
+        temp_path.write_text("test content")
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_file.write("test content")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
+        checksum = service._calculate_file_checksum(temp_path)
         
-        try:
-            checksum = service._calculate_file_checksum(temp_path)
-            
-            # Verify checksum is MD5 hex string
-            assert len(checksum) == 32
-            assert all(c in '0123456789abcdef' for c in checksum)
-            
-            # Verify consistent checksums
-            checksum2 = service._calculate_file_checksum(temp_path)
-            assert checksum == checksum2
-            
-        finally:
-            temp_path.unlink()
+        # Verify checksum is a BLAKE2b-128 hex string
+        assert checksum == hashlib.blake2b(b"test content", digest_size=16).hexdigest()
+        assert len(checksum) == 32
+        assert all(c in '0123456789abcdef' for c in checksum)
+        
+        # Verify consistent checksums
+        checksum2 = service._calculate_file_checksum(temp_path)
+        assert checksum == checksum2
 
-    def test_load_manifest_success(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    def test_load_manifest_success(self, service, temp_export_dir):
         """Test successful manifest loading."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         manifest = service._load_manifest(temp_export_dir)
         
         assert isinstance(manifest, ExportManifest)
@@ -177,40 +238,28 @@ class TestIngestionService:
         assert manifest.total_episodes == 2
         assert "SNCA" in manifest.genes
 
-    def test_load_manifest_missing_file(self, mock_settings, mock_graphiti_client):
-        """Test manifest loading with missing file."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            export_dir = Path(temp_dir) / "empty_export"
-            export_dir.mkdir()
-            
-            with pytest.raises(ManifestValidationError) as exc_info:
-                service._load_manifest(export_dir)
-            
-            assert "Manifest file not found" in str(exc_info.value)
-
-    def test_load_manifest_invalid_json(self, mock_settings, mock_graphiti_client):
-        """Test manifest loading with invalid JSON."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            export_dir = Path(temp_dir) / "invalid_export"
-            export_dir.mkdir()
-            
-            manifest_path = export_dir / "manifest.json"
-            with open(manifest_path, 'w') as f:
-                f.write("invalid json {")
-            
-            with pytest.raises(ManifestValidationError) as exc_info:
-                service._load_manifest(export_dir)
-            
-            assert "Invalid JSON in manifest" in str(exc_info.value)
-
-    def test_discover_episode_files(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    @pytest.mark.parametrize("filename,content,exc_type,expected_msg", [
+        ("manifest.json", None, ManifestValidationError, "Manifest file not found"),
+        ("manifest.json", "invalid json {", ManifestValidationError, "Invalid JSON in manifest"),
+        ("manifest.json", '{"export_info": {}}', ManifestValidationError, "Failed to parse manifest"),
+        ("episode.json", "invalid json {", IngestionError, "Invalid JSON in episode file"),
+    ], ids=["manifest_missing", "manifest_invalid_json", "manifest_invalid_schema", "episode_invalid_json"])
+    def test_load_file_errors(self, service, tmp_path, filename, content, exc_type, expected_msg):
+        """Test manifest and episode loading reject missing, malformed and invalid files."""
+        file_path = tmp_path / filename
+        if content is not None:
+            file_path.write_text(content)
+        
+        with pytest.raises(exc_type) as exc_info:
+            if filename == "manifest.json":
+                service._load_manifest(tmp_path)
+            else:
+                service._load_episode_from_file(file_path, validate_checksum=False)
+        
+        assert expected_msg in str(exc_info.value)
+
+    def test_discover_episode_files(self, service, temp_export_dir):
         """Test episode file discovery."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         episode_files = service._discover_episode_files(temp_export_dir)
         
         assert len(episode_files) == 2
@@ -218,10 +267,8 @@ class TestIngestionService:
         assert any("SNCA_gene_profile.json" in str(f) for f in episode_files)
         assert any("SNCA_gwas_evidence.json" in str(f) for f in episode_files)
 
-    def test_load_episode_from_file(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    def test_load_episode_from_file(self, service, temp_export_dir):
         """Test loading episode from file."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         episode_files = service._discover_episode_files(temp_export_dir)
         gene_profile_file = next(f for f in episode_files if "gene_profile" in str(f))
         
@@ -234,10 +281,8 @@ class TestIngestionService:
         assert episode.metadata.episode_type == "gene_profile"
         assert episode.metadata.file_size > 0
 
-    def test_load_episode_with_checksum_validation(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    def test_load_episode_with_checksum_validation(self, service, temp_export_dir):
         """Test loading episode with checksum validation."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         episode_files = service._discover_episode_files(temp_export_dir)
         gene_profile_file = next(f for f in episode_files if "gene_profile" in str(f))
         
@@ -246,68 +291,33 @@ class TestIngestionService:
         assert episode.metadata.checksum is not None
         assert len(episode.metadata.checksum) == 32
 
-    def test_load_episode_invalid_json(self, mock_settings, mock_graphiti_client):
-        """Test loading episode with invalid JSON."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            temp_file.write("invalid json {")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
-        
-        try:
-            with pytest.raises(IngestionError) as exc_info:
-                service._load_episode_from_file(temp_path, validate_checksum=False)
-            
-            assert "Invalid JSON in episode file" in str(exc_info.value)
-            
-        finally:
-            temp_path.unlink()
-
-    def test_validate_file_integrity_success(self, mock_settings, mock_graphiti_client):
+    @pytest.mark.real_checksum
+    def test_validate_file_integrity_success(self, service, tmp_path):
         """Test successful file integrity validation."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+        temp_path = tmp_path / "file.txt"
+        temp_path.write_text("test content")
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_file.write("test content")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
+        # Calculate expected checksum
+        expected_checksum = service._calculate_file_checksum(temp_path)
         
-        try:
-            # Calculate expected checksum
-            expected_checksum = service._calculate_file_checksum(temp_path)
-            
-            # Should succeed with correct checksum
-            result = service._validate_file_integrity(temp_path, expected_checksum)
-            assert result is True
-            
-        finally:
-            temp_path.unlink()
+        # Should succeed with correct checksum
+        result = service._validate_file_integrity(temp_path, expected_checksum)
+        assert result is True
 
-    def test_validate_file_integrity_mismatch(self, mock_settings, mock_graphiti_client):
+    @pytest.mark.real_checksum
+    def test_validate_file_integrity_mismatch(self, service, tmp_path):
         """Test file integrity validation with checksum mismatch."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+        temp_path = tmp_path / "file.txt"
+        temp_path.write_text("test content")
+        wrong_checksum = "wrong_checksum_value"
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_file.write("test content")
-            temp_file.flush()
-            temp_path = Path(temp_file.name)
+        with pytest.raises(FileIntegrityError) as exc_info:
+            service._validate_file_integrity(temp_path, wrong_checksum)
         
-        try:
-            wrong_checksum = "wrong_checksum_value"
-            
-            with pytest.raises(FileIntegrityError) as exc_info:
-                service._validate_file_integrity(temp_path, wrong_checksum)
-            
-            assert "Checksum mismatch" in str(exc_info.value)
-            
-        finally:
-            temp_path.unlink()
+        assert "Checksum mismatch" in str(exc_info.value)
 
-    def test_get_episode_processing_order(self, mock_settings, mock_graphiti_client):
+    def test_get_episode_processing_order(self, service):
         """Test episode processing order sorting."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         # Create episodes with different types
         episodes = []
         episode_types = ["integration", "gene_profile", "pathway_evidence", "gwas_evidence"]
@@ -339,11 +349,8 @@ class TestIngestionService:
         
         assert actual_order == expected_order
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_success(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    async def test_process_export_directory_success(self, service, mock_graphiti_client, temp_export_dir, fast_manifest_loader):
         """Test successful export directory processing."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         result = await service.process_export_directory(temp_export_dir, validate_files=False)
         
         assert result["status"] == IngestionStatus.SUCCESS
@@ -356,44 +363,25 @@ class TestIngestionService:
         # Verify GraphitiClient was called
         mock_graphiti_client.add_episodes_batch.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_missing_manifest(self, mock_settings, mock_graphiti_client):
+    async def test_process_export_directory_missing_manifest(self, service, tmp_path):
         """Test export directory processing with missing manifest."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+        result = await service.process_export_directory(tmp_path)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            export_dir = Path(temp_dir) / "empty_export"
-            export_dir.mkdir()
-            
-            result = await service.process_export_directory(export_dir)
-            
-            assert result["status"] == IngestionStatus.FAILED
-            assert "Export validation failed" in result["error"]
+        assert result["status"] == IngestionStatus.FAILED
+        assert "Export validation failed" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_no_files(self, mock_settings, mock_graphiti_client, sample_manifest_data):
+    async def test_process_export_directory_no_files(self, service, sample_manifest_bytes, tmp_path):
         """Test export directory processing with no episode files."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+        # Create manifest but no episode files
+        (tmp_path / "manifest.json").write_bytes(sample_manifest_bytes)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            export_dir = Path(temp_dir) / "empty_export"
-            export_dir.mkdir()
-            
-            # Create manifest but no episode files
-            manifest_path = export_dir / "manifest.json"
-            with open(manifest_path, 'w') as f:
-                json.dump(sample_manifest_data, f)
-            
-            result = await service.process_export_directory(export_dir)
-            
-            assert result["status"] == IngestionStatus.FAILED
-            assert "No episode files found" in result["error"]
+        result = await service.process_export_directory(tmp_path)
+        
+        assert result["status"] == IngestionStatus.FAILED
+        assert "No episode files found" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_with_filter(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    async def test_process_export_directory_with_filter(self, service, mock_graphiti_client, temp_export_dir, fast_manifest_loader):
         """Test export directory processing with episode type filter."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         result = await service.process_export_directory(
             temp_export_dir, 
             validate_files=False,
@@ -408,11 +396,8 @@ class TestIngestionService:
         assert len(call_args) == 1
         assert call_args[0].metadata.episode_type == "gene_profile"
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_already_processed(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    async def test_process_export_directory_already_processed(self, service, temp_export_dir, fast_manifest_loader):
         """Test export directory processing with already processed episodes."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         # Pre-populate processed episodes
         service._processed_episodes.add("Gene_Profile_SNCA")
         service._processed_episodes.add("GWAS_Evidence_SNCA")
@@ -424,11 +409,8 @@ class TestIngestionService:
         assert "export_id" in result
         assert "processing_time" in result
 
-    @pytest.mark.asyncio
-    async def test_process_export_directory_force_reingest(self, mock_settings, mock_graphiti_client, temp_export_dir):
+    async def test_process_export_directory_force_reingest(self, service, temp_export_dir, fast_manifest_loader):
         """Test export directory processing with force reingest."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         # Pre-populate processed episodes
         service._processed_episodes.add("Gene_Profile_SNCA")
         service._processed_episodes.add("GWAS_Evidence_SNCA")
@@ -442,60 +424,22 @@ class TestIngestionService:
         assert result["status"] == IngestionStatus.SUCCESS
         assert result["total_episodes_loaded"] == 2  # Force reprocessed
 
-    @pytest.mark.asyncio
-    async def test_process_single_episode_success(self, mock_settings, mock_graphiti_client):
+    async def test_process_single_episode_success(self, service, mock_graphiti_client, sample_episode):
         """Test successful single episode processing."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile",
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/snca.json"),
-            file_size=1024
-        )
-        
-        episode = GraphitiEpisode(
-            episode_name="Gene_Profile_SNCA",
-            episode_body="SNCA episode content",
-            source="test",
-            source_description="test",
-            metadata=metadata
-        )
-        
-        result = await service.process_single_episode(episode)
+        result = await service.process_single_episode(sample_episode)
         
         assert result["status"] == IngestionStatus.SUCCESS
         assert "processing_time" in result
-        assert episode.episode_name in service._processed_episodes
+        assert sample_episode.episode_name in service._processed_episodes
         
-        mock_graphiti_client.add_episode.assert_called_once_with(episode)
+        mock_graphiti_client.add_episode.assert_called_once_with(sample_episode)
 
-    @pytest.mark.asyncio
-    async def test_process_single_episode_already_processed(self, mock_settings, mock_graphiti_client):
+    async def test_process_single_episode_already_processed(self, service, mock_graphiti_client, sample_episode):
         """Test single episode processing when already processed."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile",
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/snca.json"),
-            file_size=1024
-        )
-        
-        episode = GraphitiEpisode(
-            episode_name="Gene_Profile_SNCA",
-            episode_body="SNCA episode content",
-            source="test",
-            source_description="test",
-            metadata=metadata
-        )
-        
         # Pre-mark as processed
-        service._processed_episodes.add(episode.episode_name)
+        service._processed_episodes.add(sample_episode.episode_name)
         
-        result = await service.process_single_episode(episode)
+        result = await service.process_single_episode(sample_episode)
         
         assert result["status"] == IngestionStatus.SUCCESS
         assert "already processed" in result["message"]
@@ -503,40 +447,28 @@ class TestIngestionService:
         # Verify GraphitiClient was not called
         mock_graphiti_client.add_episode.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_process_single_episode_graphiti_error(self, mock_settings, mock_graphiti_client):
-        """Test single episode processing with GraphitiClient error."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
+    async def test_process_single_episode_force_reingest(self, service, mock_graphiti_client, sample_episode):
+        """Test force_reingest bypasses the processed-episode check without any file I/O."""
+        service._processed_episodes.add(sample_episode.episode_name)
+        
+        result = await service.process_single_episode(sample_episode, force_reingest=True)
         
+        assert result["status"] == IngestionStatus.SUCCESS
+        mock_graphiti_client.add_episode.assert_called_once_with(sample_episode)
+
+    async def test_process_single_episode_graphiti_error(self, service, mock_graphiti_client, sample_episode):
+        """Test single episode processing with GraphitiClient error."""
         # Mock GraphitiClient to raise exception
         mock_graphiti_client.add_episode.side_effect = Exception("Graphiti error")
         
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile",
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/snca.json"),
-            file_size=1024
-        )
-        
-        episode = GraphitiEpisode(
-            episode_name="Gene_Profile_SNCA",
-            episode_body="SNCA episode content",
-            source="test",
-            source_description="test",
-            metadata=metadata
-        )
-        
-        result = await service.process_single_episode(episode)
+        result = await service.process_single_episode(sample_episode)
         
         assert result["status"] == IngestionStatus.FAILED
         assert "Graphiti error" in result["error"]
-        assert episode.episode_name not in service._processed_episodes
+        assert sample_episode.episode_name not in service._processed_episodes
 
-    def test_get_processing_stats(self, mock_settings, mock_graphiti_client):
+    def test_get_processing_stats(self, service):
         """Test processing statistics retrieval."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         # Add some processed episodes
         service._processed_episodes.add("Gene_Profile_SNCA")
         service._processed_episodes.add("GWAS_Evidence_LRRK2")
@@ -548,10 +480,8 @@ class TestIngestionService:
         assert "GWAS_Evidence_LRRK2" in stats["processed_episode_names"]
         assert "timestamp" in stats
 
-    def test_clear_processing_history(self, mock_settings, mock_graphiti_client):
+    def test_clear_processing_history(self, service):
         """Test clearing processing history."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
         # Add some processed episodes
         service._processed_episodes.add("Gene_Profile_SNCA")
         service._processed_episodes.add("GWAS_Evidence_LRRK2")
@@ -575,38 +505,56 @@ class TestIngestionServiceCreation:
         assert service.graphiti_client == mock_graphiti_client
 
 
+@pytest.fixture(scope="class")
+def workflow_service(mock_settings):
+    """Create one IngestionService shared by the workflow steps of a class."""
+    return IngestionService(mock_settings, _FakeGraphitiClient())
+
+
+@pytest.fixture(scope="class")
+async def processed_workflow(workflow_service, temp_export_dir):
+    """Process the sample export once on the shared service."""
+    await workflow_service.process_export_directory(temp_export_dir, validate_files=True)
+    return workflow_service
+
+
 class TestIngestionServiceIntegration:
-    """Integration-style tests for IngestionService."""
+    """Integration-style tests for IngestionService.
+    
+    test_01 processes the export on its own service. Later steps share one
+    class-scoped service that processed_workflow has already run the export
+    through, so each step also runs on its own with ``-k``.
+    """
 
-    @pytest.mark.asyncio
-    async def test_end_to_end_processing_workflow(self, mock_settings, mock_graphiti_client, temp_export_dir):
-        """Test complete end-to-end processing workflow."""
-        service = IngestionService(mock_settings, mock_graphiti_client)
-        
-        # 1. Process export directory
+    async def test_01_process_export(self, service, temp_export_dir):
+        """Process the export directory."""
         result = await service.process_export_directory(temp_export_dir, validate_files=True)
         
         assert result["status"] == IngestionStatus.SUCCESS
         assert result["total_episodes_loaded"] == 2
-        
-        # 2. Verify processing stats
-        stats = service.get_processing_stats()
+
+    def test_02_processing_stats(self, processed_workflow):
+        """Verify processing stats."""
+        stats = processed_workflow.get_processing_stats()
         assert stats["total_processed_episodes"] == 2
-        
-        # 3. Try processing again (should skip already processed)
-        result2 = await service.process_export_directory(temp_export_dir, validate_files=False)
-        assert "already processed" in result2["message"]
-        
-        # 4. Force reprocess
-        result3 = await service.process_export_directory(
+
+    async def test_03_skip_already_processed(self, processed_workflow, temp_export_dir):
+        """Try processing again (should skip already processed)."""
+        result = await processed_workflow.process_export_directory(temp_export_dir, validate_files=False)
+        assert "already processed" in result["message"]
+
+    async def test_04_force_reprocess(self, processed_workflow, temp_export_dir):
+        """Force reprocess."""
+        result = await processed_workflow.process_export_directory(
             temp_export_dir, 
             validate_files=False,
             force_reingest=True
         )
-        assert result3["status"] == IngestionStatus.SUCCESS
-        assert result3["total_episodes_loaded"] == 2
-        
-        # 5. Clear history and verify
-        service.clear_processing_history()
-        stats_after_clear = service.get_processing_stats()
-        assert stats_after_clear["total_processed_episodes"] == 0
\ No newline at end of file
+        assert result["status"] == IngestionStatus.SUCCESS
+        assert result["total_episodes_loaded"] == 2
+
+    def test_05_clear_history(self, processed_workflow):
+        """Clear history and verify."""
+        processed_workflow.clear_processing_history()
+        stats_after_clear = processed_workflow.get_processing_stats()
+        assert stats_after_clear["total_processed_episodes"] == 0
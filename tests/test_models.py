@@ -1,6 +1,5 @@
 """Tests for Pydantic models."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -24,50 +23,104 @@ from pd_graphiti_service.models.responses import (
     StatusResponse
 )
 
+_FROZEN_TS = datetime(2025, 7, 31, 12, 0, 0)
+_TEST_JSON_PATH = Path("/test/path.json")
+_TEST_SNCA_PATH = Path("/test/snca.json")
+_TEST_LRRK2_PATH = Path("/test/lrrk2.json")
+_TEST_EXPORTS_DIR = Path("/test/exports")
+
+
+def _mk_metadata(**overrides):
+    """Build an EpisodeMetadata without validation for tests that trust their input."""
+    fields = {
+        "gene_symbol": "SNCA",
+        "episode_type": "gene_profile",
+        "export_timestamp": _FROZEN_TS,
+        "file_path": _TEST_SNCA_PATH,
+        "file_size": 1024,
+        "checksum": None,
+        "validation_status": IngestionStatus.PENDING,
+        "error_message": None,
+    }
+    fields.update(overrides)
+    return EpisodeMetadata.model_construct(**fields)
+
+
+# Per-gene field values shared by the parametrized sample_metadata fixture
+_METADATA_CASES = {
+    "SNCA": dict(episode_type="gene_profile", file_size=1024),
+    "LRRK2": dict(episode_type="gwas_evidence", file_size=2048),
+}
+
+
+@pytest.fixture(scope="session", params=list(_METADATA_CASES))
+def sample_metadata(request):
+    """Validated metadata for each gene in _METADATA_CASES; treat as read-only."""
+    return EpisodeMetadata(
+        gene_symbol=request.param,
+        export_timestamp=_FROZEN_TS,
+        file_path=_TEST_JSON_PATH,
+        **_METADATA_CASES[request.param]
+    )
+
+
+@pytest.fixture(scope="session")
+def snca_metadata():
+    """Shared SNCA gene profile metadata; treat as read-only."""
+    return EpisodeMetadata(
+        gene_symbol="SNCA",
+        episode_type="gene_profile",
+        export_timestamp=_FROZEN_TS,
+        file_path=_TEST_SNCA_PATH,
+        file_size=1024,
+        checksum="test_checksum"
+    )
+
+
+@pytest.fixture(scope="session")
+def lrrk2_episode():
+    """Shared LRRK2 GWAS episode; treat as read-only."""
+    metadata = _mk_metadata(
+        gene_symbol="LRRK2",
+        episode_type="gwas_evidence",
+        file_path=_TEST_LRRK2_PATH,
+        file_size=2048
+    )
+    return GraphitiEpisode(
+        episode_name="Gene_Profile_LRRK2",
+        episode_body="LRRK2 is a key protein kinase...",
+        source="dagster_pipeline",
+        source_description="Generated from PD target identification pipeline",
+        metadata=metadata
+    )
+
 
 class TestBaseModels:
     """Test base models in models/__init__.py."""
 
-    def test_ingestion_status_enum(self):
+    @pytest.mark.parametrize("member,value", [
+        (IngestionStatus.PENDING, "pending"),
+        (IngestionStatus.PROCESSING, "processing"),
+        (IngestionStatus.SUCCESS, "success"),
+        (IngestionStatus.FAILED, "failed"),
+    ])
+    def test_ingestion_status_enum(self, member, value):
         """Test IngestionStatus enum values."""
-        assert IngestionStatus.PENDING == "pending"
-        assert IngestionStatus.PROCESSING == "processing"
-        assert IngestionStatus.SUCCESS == "success"
-        assert IngestionStatus.FAILED == "failed"
+        assert member == value
 
-    def test_episode_metadata_creation(self):
+    def test_episode_metadata_creation(self, sample_metadata):
         """Test EpisodeMetadata model creation."""
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile", 
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/path.json"),
-            file_size=1024
-        )
+        metadata = sample_metadata
+        expected = _METADATA_CASES[metadata.gene_symbol]
         
-        assert metadata.gene_symbol == "SNCA"
-        assert metadata.episode_type == "gene_profile"
-        assert metadata.file_size == 1024
+        assert metadata.episode_type == expected["episode_type"]
+        assert metadata.file_size == expected["file_size"]
         assert metadata.validation_status == IngestionStatus.PENDING  # default
         assert metadata.error_message is None  # default
 
-    def test_graphiti_episode_creation(self):
+    def test_graphiti_episode_creation(self, lrrk2_episode):
         """Test GraphitiEpisode model creation."""
-        metadata = EpisodeMetadata(
-            gene_symbol="LRRK2",
-            episode_type="gwas_evidence",
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/lrrk2.json"),
-            file_size=2048
-        )
-        
-        episode = GraphitiEpisode(
-            episode_name="Gene_Profile_LRRK2",
-            episode_body="LRRK2 is a key protein kinase...",
-            source="dagster_pipeline",
-            source_description="Generated from PD target identification pipeline",
-            metadata=metadata
-        )
+        episode = lrrk2_episode
         
         assert episode.episode_name == "Gene_Profile_LRRK2"
         assert episode.group_id == "pd_target_discovery"  # default
@@ -77,7 +130,7 @@ class TestBaseModels:
         """Test ExportManifest model creation."""
         manifest = ExportManifest(
             export_id="export_20250731_123456",
-            export_timestamp=datetime.now(),
+            export_timestamp=_FROZEN_TS,
             dagster_run_id="run_abc123",
             total_episodes=81,
             episode_types={"gene_profile": 14, "gwas_evidence": 14},
@@ -89,30 +142,34 @@ class TestBaseModels:
         assert len(manifest.genes) == 3
         assert manifest.episode_types["gene_profile"] == 14
 
-    def test_model_serialization(self):
+    def test_model_serialization(self, sample_metadata):
         """Test that models serialize to JSON correctly."""
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile",
-            export_timestamp=datetime(2025, 7, 31, 12, 0, 0),
-            file_path=Path("/test/snca.json"),
-            file_size=1024,
-            checksum="test_checksum"
-        )
+        metadata = sample_metadata
         
-        # Test JSON serialization
-        json_data = metadata.model_dump_json()
-        parsed_data = json.loads(json_data)
+        # Test JSON-mode serialization
+        parsed_data = metadata.model_dump(mode="json")
         
-        assert parsed_data["gene_symbol"] == "SNCA"
-        assert parsed_data["file_size"] == 1024
-        assert "2025-07-31T12:00:00" in parsed_data["export_timestamp"]
+        assert parsed_data["gene_symbol"] == metadata.gene_symbol
+        assert parsed_data["file_size"] == _METADATA_CASES[metadata.gene_symbol]["file_size"]
+        assert parsed_data["export_timestamp"] == "2025-07-31T12:00:00"
         
         # Test deserialization
         new_metadata = EpisodeMetadata.model_validate(parsed_data)
         assert new_metadata.gene_symbol == metadata.gene_symbol
         assert new_metadata.file_size == metadata.file_size
 
+    def test_model_json_round_trip(self, snca_metadata):
+        """Test that models survive a JSON string round trip."""
+        json_data = snca_metadata.model_dump_json()
+        
+        assert EpisodeMetadata.model_validate_json(json_data) == snca_metadata
+
+    def test_iso_timestamp_format(self, snca_metadata):
+        """Test that timestamps are written as ISO 8601 in JSON output."""
+        json_data = snca_metadata.model_dump_json()
+        
+        assert '"export_timestamp":"2025-07-31T12:00:00"' in json_data
+
 
 class TestRequestModels:
     """Test request models."""
@@ -135,7 +192,7 @@ class TestRequestModels:
     def test_ingest_directory_request(self):
         """Test IngestDirectoryRequest model."""
         request = IngestDirectoryRequest(
-            directory_path=Path("/test/exports"),
+            directory_path=_TEST_EXPORTS_DIR,
             validate_files=True,
             force_reingest=False,
             episode_types_filter=["gene_profile", "gwas_evidence"]
@@ -145,22 +202,14 @@ class TestRequestModels:
         assert request.validate_files is True
         assert len(request.episode_types_filter) == 2
 
-    def test_ingest_episode_request(self):
+    def test_ingest_episode_request(self, snca_metadata):
         """Test IngestEpisodeRequest model."""
-        metadata = EpisodeMetadata(
-            gene_symbol="SNCA",
-            episode_type="gene_profile",
-            export_timestamp=datetime.now(),
-            file_path=Path("/test/snca.json"),
-            file_size=1024
-        )
-        
-        episode = GraphitiEpisode(
+        episode = GraphitiEpisode.model_construct(
             episode_name="Gene_Profile_SNCA",
             episode_body="SNCA content...",
             source="dagster_pipeline",
             source_description="Test episode",
-            metadata=metadata
+            metadata=snca_metadata
         )
         
         request = IngestEpisodeRequest(
@@ -186,10 +235,13 @@ class TestResponseModels:
             ping_data="test_echo"
         )
         
-        assert response.status == "healthy"
-        assert response.version == "0.1.0"  # default
-        assert response.neo4j_connected is True
-        assert response.ping_data == "test_echo"
+        expected = {
+            "status": "healthy",
+            "version": "0.1.0",  # default
+            "neo4j_connected": True,
+            "ping_data": "test_echo",
+        }
+        assert expected.items() <= response.model_dump().items()
 
     def test_ingestion_response(self):
         """Test IngestionResponse model."""
@@ -208,14 +260,14 @@ class TestResponseModels:
             episodes_processed=1,
             episodes_successful=1,
             episodes_failed=0,
-            start_time=datetime.now(),
+            start_time=_FROZEN_TS,
             episode_results=[episode_result]
         )
         
-        assert response.episodes_processed == 1
-        assert response.episodes_successful == 1
-        assert len(response.episode_results) == 1
-        assert response.episode_results[0].episode_name == "Gene_Profile_SNCA"
+        dumped = response.model_dump()
+        expected = {"episodes_processed": 1, "episodes_successful": 1}
+        assert expected.items() <= dumped.items()
+        assert [r["episode_name"] for r in dumped["episode_results"]] == ["Gene_Profile_SNCA"]
 
     def test_status_response(self):
         """Test StatusResponse model."""
@@ -224,7 +276,7 @@ class TestResponseModels:
         current_op = CurrentOperation(
             operation_type="directory_ingestion",
             operation_id="op_123",
-            started_at=datetime.now(),
+            started_at=_FROZEN_TS,
             progress_percentage=50.0,
             current_step="Processing episode 5 of 10"
         )
@@ -237,44 +289,43 @@ class TestResponseModels:
             uptime_seconds=3600.0
         )
         
-        assert response.service_status == "processing"
-        assert response.current_operation.progress_percentage == 50.0
-        assert response.total_episodes_ingested == 75
+        dumped = response.model_dump()
+        expected = {"service_status": "processing", "total_episodes_ingested": 75}
+        assert expected.items() <= dumped.items()
+        assert dumped["current_operation"]["progress_percentage"] == 50.0
 
     def test_response_serialization(self):
         """Test that response models serialize correctly."""
         response = HealthResponse(
             status="healthy",
-            timestamp=datetime(2025, 7, 31, 12, 0, 0),
+            timestamp=_FROZEN_TS,
             neo4j_connected=True
         )
         
-        json_data = response.model_dump_json()
-        parsed_data = json.loads(json_data)
+        parsed_data = response.model_dump(mode="json")
         
         assert parsed_data["status"] == "healthy"
-        assert "2025-07-31T12:00:00" in parsed_data["timestamp"]
+        assert parsed_data["timestamp"] == "2025-07-31T12:00:00"
         assert parsed_data["neo4j_connected"] is True
 
 
 class TestValidation:
     """Test model validation."""
 
-    def test_episode_metadata_validation(self):
+    @pytest.mark.parametrize("kwargs", [
+        {},  # Missing required fields
+        dict(
+            gene_symbol="SNCA",
+            episode_type="gene_profile",
+            export_timestamp=_FROZEN_TS,
+            file_path=_TEST_JSON_PATH,
+            file_size=-1  # Invalid (negative)
+        ),
+    ], ids=["missing_fields", "negative_file_size"])
+    def test_episode_metadata_validation(self, kwargs):
         """Test validation errors for EpisodeMetadata."""
         with pytest.raises(ValidationError):
-            # Missing required fields
-            EpisodeMetadata()
-            
-        with pytest.raises(ValidationError):
-            # Invalid file_size (negative)
-            EpisodeMetadata(
-                gene_symbol="SNCA",
-                episode_type="gene_profile",
-                export_timestamp=datetime.now(),
-                file_path=Path("/test/path.json"),
-                file_size=-1  # Invalid
-            )
+            EpisodeMetadata(**kwargs)
 
     def test_path_validation(self):
         """Test Path field validation."""
@@ -283,5 +334,5 @@ class TestValidation:
         assert isinstance(request.directory_path, Path)
         
         # Test Path object input
-        request = IngestDirectoryRequest(directory_path=Path("/test/exports"))
+        request = IngestDirectoryRequest(directory_path=_TEST_EXPORTS_DIR)
         assert isinstance(request.directory_path, Path)
\ No newline at end of file